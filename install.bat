@@ -9,7 +9,7 @@ echo.
 
 :: Install dependencies
 echo [*] Installing dependencies...
-pip install -q requests rich pyyaml
+pip install -q "httpx[http2]" rich pyyaml
 
 if %ERRORLEVEL% EQU 0 (
     echo.
@@ -16,7 +16,7 @@ fi
 
 # Install dependencies
 echo "[*] Installing dependencies..."
-pip3 install -q requests rich pyyaml
+pip3 install -q "httpx[http2]" rich pyyaml
 
 if [ $? -eq 0 ]; then
     echo ""
@@ -3,12 +3,13 @@ Main search engine with Recursive Time Slicing algorithm.
 Implements intelligent date-range splitting to bypass GitHub's 1000 result limit.
 """
 
+import asyncio
 import re
-import time
+from collections import OrderedDict
+from contextlib import nullcontext
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Dict, Generator, List, Optional, Tuple
-from urllib.parse import quote
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Generator, Iterable, List, Optional, Tuple
 
 from ..managers.auth_manager import AuthManager
 from ..managers.output_manager import OutputManager
@@ -16,18 +17,27 @@ from ..utils import logger
 from ..utils.helpers import (
     SearchResult,
     ScanState,
+    api_error_message,
     get_days_in_month,
     get_months_in_year,
+    json_loads,
+    quote_domains,
 )
 from ..utils.http_client import HttpClient
 from .rate_limiter import RateLimiter
 
+# Gist links in search results HTML. Format: /username/gist_id
+_GIST_HREF_RE = re.compile(r'href="(/[^/]+/[a-f0-9]{32})"')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TimeSlice:
     """
     Represents a time slice for recursive searching.
     
+    Instances are immutable and hashable; use ``TimeSlice.of`` to share
+    identical slices (e.g. between repository and code searches).
+    
     Attributes:
         start_date: Start of the slice (YYYY-MM-DD).
         end_date: End of the slice (YYYY-MM-DD).
@@ -39,14 +49,21 @@ class TimeSlice:
     
     def __str__(self) -> str:
         return f"{self.start_date}..{self.end_date}"
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def of(cls, start_date: str, end_date: str, level: str = "year") -> "TimeSlice":
+        """Get a shared TimeSlice instance for the given range."""
+        return cls(start_date, end_date, level)
 
 
 class SearchEngine:
     """
     GitHub search engine with Recursive Time Slicing.
     
-    The engine recursively splits time ranges when result count exceeds
-    GitHub's 1000 result limit. Goes from years -> months -> days.
+    The engine splits time ranges when result count exceeds GitHub's
+    1000 result limit. Goes from years -> months -> days. Slices are
+    kept on a worklist consumed by ``search.max_concurrency`` workers.
     
     Attributes:
         auth: Authentication manager.
@@ -59,6 +76,9 @@ class SearchEngine:
     
     GITHUB_MAX_RESULTS = 1000
     MAX_PER_PAGE = 100
+    OUTPUT_BATCH_SIZE = 100
+    MAX_ATTEMPTS = 6  # per request, across rate limit and abuse retries
+    ETAG_CACHE_SIZE = 256
     
     def __init__(
         self,
@@ -66,6 +86,7 @@ class SearchEngine:
         http_client: HttpClient,
         output_manager: OutputManager,
         config: Dict[str, Any],
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize the search engine.
@@ -75,25 +96,38 @@ class SearchEngine:
             http_client: HTTP client.
             output_manager: Output handler.
             config: Configuration dictionary.
+            rate_limiter: Limiter to share with other engines (optional).
         """
         self.auth = auth_manager
         self.http = http_client
         self.output = output_manager
         self.config = config
-        self.rate_limiter = RateLimiter()
         self.state = ScanState()
         
         self.api_base = config.get("github", {}).get("api_base", "https://api.github.com")
         self.per_page = config.get("search", {}).get("per_page", 100)
+        self._max_pages = self.GITHUB_MAX_RESULTS // self.per_page
         self.abuse_sleep = config.get("network", {}).get("abuse_sleep", 60)
+        self.rate_limiter = rate_limiter or RateLimiter(backoff_base=self.abuse_sleep)
+        self.max_concurrency = config.get("search", {}).get("max_concurrency", 5)
+        # Caps in-flight searches, workers' first pages and later pages alike
+        self._search_slots = asyncio.Semaphore(self.max_concurrency)
+        self._work_total = 0
+        self._out_buf: List[SearchResult] = []
+        self._domain_q = ""
+        
+        # (search_type, query, page) -> (etag, parsed body), LRU ordered
+        self._etag_cache: "OrderedDict[Tuple[str, str, int], Tuple[str, Dict[str, Any]]]" = OrderedDict()
     
-    def search_domain(
+    async def search_domain(
         self,
         domain: str,
         start_year: int,
         end_year: int,
         search_repos: bool = True,
         search_gists: bool = True,
+        progress: Any = None,
+        query: Optional[str] = None,
     ) -> ScanState:
         """
         Search for a domain across GitHub repositories and gists.
@@ -104,6 +138,10 @@ class SearchEngine:
             end_year: End year for search range.
             search_repos: Whether to search repositories.
             search_gists: Whether to search gists.
+            progress: Shared progress display (optional). When omitted
+                the engine creates and shows its own.
+            query: Search term to use instead of the quoted domain,
+                e.g. several domains from quote_domains().
             
         Returns:
             Final scan state with results.
@@ -111,53 +149,110 @@ class SearchEngine:
         logger.info(f"Starting search for: {domain}")
         logger.info(f"Year range: {start_year} - {end_year}")
         
+        # Quote the domain for exact match, once per scan
+        self._domain_q = query or quote_domains((domain,))
+        
         # Generate initial time slices (one per year)
         slices = self._generate_year_slices(start_year, end_year)
         
-        progress = logger.create_progress()
+        search_types = []
+        if search_repos:
+            search_types.append("repositories")
+        if search_gists:
+            # Code search (which includes gists in results)
+            search_types.append("code")
+        
+        # Worklist of (time_slice, search_type); oversized slices are
+        # split and their sub-slices pushed back onto the queue
+        queue: asyncio.Queue = asyncio.Queue()
+        for time_slice in slices:
+            for search_type in search_types:
+                queue.put_nowait((time_slice, search_type))
+        self._work_total = queue.qsize()
+        
+        # Only one live display may run at a time, so concurrent scans
+        # add their task to the caller's progress instead
+        shared_progress = progress is not None
+        if shared_progress:
+            display = nullcontext()
+        else:
+            progress = logger.create_progress()
+            display = progress
         
-        with progress:
+        with display:
             overall_task = progress.add_task(
                 f"[cyan]Scanning {domain}",
-                total=len(slices),
+                total=self._work_total,
             )
             
-            for time_slice in slices:
+            workers = [
+                asyncio.create_task(
+                    self._worker(domain, queue, progress, overall_task)
+                )
+                for _ in range(self.max_concurrency)
+            ]
+            try:
+                await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                self._flush_output()
+                # Don't leave finished bars behind in the caller's display
+                if shared_progress:
+                    progress.remove_task(overall_task)
+        
+        if self.state.interrupted:
+            logger.warning("Scan interrupted by user")
+        
+        return self.state
+    
+    async def _worker(
+        self,
+        domain: str,
+        queue: asyncio.Queue,
+        progress: Any,
+        task_id: Any,
+    ) -> None:
+        """
+        Consume slices from the worklist until cancelled.
+        
+        Once the scan is interrupted, remaining items are drained
+        without making requests so that queue.join() returns.
+        
+        Args:
+            domain: Target domain.
+            queue: Worklist of (time_slice, search_type) items.
+            progress: Progress bar instance.
+            task_id: Progress task to advance.
+        """
+        while True:
+            time_slice, search_type = await queue.get()
+            try:
                 if self.state.interrupted:
-                    logger.warning("Scan interrupted by user")
-                    break
+                    continue
                 
                 self.state.current_slice = str(time_slice)
+                label = "[cyan]Repos" if search_type == "repositories" else "[magenta]Code"
+                progress.update(task_id, description=f"{label}: {time_slice}")
                 
-                # Search repositories
-                if search_repos:
-                    progress.update(
-                        overall_task,
-                        description=f"[cyan]Repos: {time_slice}",
-                    )
-                    self._recursive_search(
-                        domain=domain,
-                        time_slice=time_slice,
-                        search_type="repositories",
-                        progress=progress,
-                    )
-                
-                # Search code (which includes gists in results)
-                if search_gists:
-                    progress.update(
-                        overall_task,
-                        description=f"[magenta]Code: {time_slice}",
-                    )
-                    self._recursive_search(
-                        domain=domain,
-                        time_slice=time_slice,
-                        search_type="code",
-                        progress=progress,
-                    )
-                
-                progress.update(overall_task, advance=1)
-        
-        return self.state
+                sub_slices = await self._search_slice(
+                    domain, time_slice, search_type, progress
+                )
+                added = 0
+                for sub_slice in sub_slices:
+                    if self.state.interrupted:
+                        break
+                    queue.put_nowait((sub_slice, search_type))
+                    added += 1
+                if added:
+                    self._work_total += added
+                    progress.update(task_id, total=self._work_total)
+            except Exception as e:
+                logger.error(f"Search failed for {time_slice}: {e}")
+            finally:
+                progress.update(task_id, advance=1)
+                queue.task_done()
     
     def _generate_year_slices(self, start: int, end: int) -> List[TimeSlice]:
         """
@@ -172,116 +267,106 @@ class SearchEngine:
         """
         slices = []
         for year in range(start, end + 1):
-            slices.append(TimeSlice(
+            slices.append(TimeSlice.of(
                 start_date=f"{year}-01-01",
                 end_date=f"{year}-12-31",
                 level="year",
             ))
         return slices
     
-    def _recursive_search(
+    async def _search_slice(
         self,
         domain: str,
         time_slice: TimeSlice,
         search_type: str,
         progress: Any,
-        depth: int = 0,
-    ) -> None:
+    ) -> Iterable[TimeSlice]:
         """
-        Recursively search with time slicing.
+        Search one time slice, or split it if it is too large.
         
-        If result count exceeds 1000, splits the time range and recurses.
+        If result count exceeds 1000, returns the sub-slices (lazily)
+        for the caller to queue instead of fetching.
         
         Args:
             domain: Target domain.
             time_slice: Current time slice.
             search_type: Type of search (repositories/code).
             progress: Progress bar instance.
-            depth: Current recursion depth.
+            
+        Returns:
+            Sub-slices still to be searched (empty when done).
         """
-        if self.state.interrupted:
-            return
-        
-        # First, get result count for this slice
-        count = self._get_result_count(domain, time_slice, search_type)
+        # The first page doubles as the result count probe
+        count, items = await self._fetch_first_page(domain, time_slice, search_type)
         
         if count == 0:
             logger.info(f"No results for {time_slice} ({search_type})")
-            return
+            return ()
         
         logger.info(f"Found {count} results for {time_slice} ({search_type})")
         
-        if count <= self.GITHUB_MAX_RESULTS:
-            # Can fetch all results directly
-            self._fetch_all_pages(domain, time_slice, search_type, progress)
-        else:
+        if count > self.GITHUB_MAX_RESULTS:
             # Need to split time range
             logger.warning(
                 f"Results exceed 1000 for {time_slice}, splitting..."
             )
-            sub_slices = self._split_time_slice(time_slice)
+            if time_slice.level != "day":
+                return self._split_time_slice(time_slice)
             
-            if not sub_slices:
-                # Already at day level, fetch what we can
-                logger.warning(
-                    f"At day level with {count} results. Fetching max 1000."
-                )
-                self._fetch_all_pages(domain, time_slice, search_type, progress)
-                return
-            
-            for sub_slice in sub_slices:
-                if self.state.interrupted:
-                    return
-                self._recursive_search(
-                    domain, sub_slice, search_type, progress, depth + 1
-                )
+            # Already at day level, fetch what we can
+            logger.warning(
+                f"At day level with {count} results. Fetching max 1000."
+            )
+        
+        # Page 1 is already in hand; fetch the rest
+        self._process_items(items, search_type)
+        if count > self.per_page:
+            await self._fetch_all_pages(
+                domain, time_slice, search_type, progress, count, start_page=2
+            )
+        return ()
     
-    def _split_time_slice(self, time_slice: TimeSlice) -> List[TimeSlice]:
+    def _split_time_slice(
+        self, time_slice: TimeSlice
+    ) -> Generator[TimeSlice, None, None]:
         """
-        Split a time slice into smaller chunks.
+        Split a time slice into smaller chunks, lazily.
         
         Years -> Months -> Days
         
         Args:
             time_slice: Time slice to split.
             
-        Returns:
-            List of smaller time slices.
+        Yields:
+            Smaller time slices (none at day level).
         """
         if time_slice.level == "year":
             # Split into months
             year = int(time_slice.start_date[:4])
-            months = get_months_in_year(year)
-            return [
-                TimeSlice(start, end, "month")
-                for start, end in months
-            ]
+            for start, end in get_months_in_year(year):
+                yield TimeSlice.of(start, end, "month")
         
         elif time_slice.level == "month":
             # Split into days
             parts = time_slice.start_date.split("-")
             year = int(parts[0])
             month = int(parts[1])
-            days = get_days_in_month(year, month)
-            return [
-                TimeSlice(start, end, "day")
-                for start, end in days
-            ]
+            for start, end in get_days_in_month(year, month):
+                yield TimeSlice.of(start, end, "day")
         
-        else:
-            # Already at day level, cannot split further
-            return []
+        # Already at day level, cannot split further
     
-    def _get_result_count(
+    async def _fetch_first_page(
         self,
         domain: str,
         time_slice: TimeSlice,
         search_type: str,
-    ) -> int:
+    ) -> Tuple[int, List[Dict[str, Any]]]:
         """
-        Get the total result count for a search query.
+        Fetch the first page of results along with the total count.
         
-        Uses per_page=1 to minimize bandwidth.
+        The total count decides whether the slice must be split, so this
+        single request replaces a separate per_page=1 count probe.
         
         Args:
             domain: Target domain.
@@ -289,31 +374,61 @@ class SearchEngine:
             search_type: Search type.
             
         Returns:
-            Total result count.
+            Tuple of (total_count, first page items).
         """
-        query = self._build_query(domain, time_slice)
-        endpoint = f"{self.api_base}/search/{search_type}"
-        
         params = {
-            "q": query,
-            "per_page": 1,
+            "q": self._build_query(time_slice),
+            "per_page": self.per_page,
             "page": 1,
+            "sort": "indexed",
+            "order": "desc",
         }
         
-        response = self._make_request(endpoint, params)
+        data = await self._search_page(search_type, params)
+        
+        if data is not None:
+            return data.get("total_count", 0), data.get("items", [])
         
-        if response and response.status_code == 200:
-            data = response.json()
-            return data.get("total_count", 0)
+        return 0, []
+    
+    def _process_items(self, items: List[Dict[str, Any]], search_type: str) -> None:
+        """
+        Parse raw items and record the new ones.
+        
+        Args:
+            items: Raw API response items.
+            search_type: Search type.
+        """
+        for item in items:
+            result = self._parse_result(item, search_type)
+            if result and self.state.add_result(result):
+                self._buffer_output(result)
+    
+    def _buffer_output(self, result: SearchResult) -> None:
+        """
+        Queue a new result for the output manager, writing in batches.
         
-        return 0
+        Args:
+            result: New (deduplicated) result.
+        """
+        self._out_buf.append(result)
+        if len(self._out_buf) >= self.OUTPUT_BATCH_SIZE:
+            self._flush_output()
+    
+    def _flush_output(self) -> None:
+        """Write any buffered results to the output manager."""
+        if self._out_buf:
+            self.output.add_results(self._out_buf)
+            self._out_buf = []
     
-    def _fetch_all_pages(
+    async def _fetch_all_pages(
         self,
         domain: str,
         time_slice: TimeSlice,
         search_type: str,
         progress: Any,
+        total: int,
+        start_page: int = 1,
     ) -> None:
         """
         Fetch all pages of results for a time slice.
@@ -323,124 +438,268 @@ class SearchEngine:
             time_slice: Time slice.
             search_type: Search type.
             progress: Progress bar.
+            total: Total result count reported by the first page.
+            start_page: First page to fetch.
         """
-        query = self._build_query(domain, time_slice)
-        endpoint = f"{self.api_base}/search/{search_type}"
+        async for result in self._iter_all_pages(
+            domain, time_slice, search_type, total, start_page
+        ):
+            if self.state.add_result(result):
+                self._buffer_output(result)
+    
+    async def _iter_all_pages(
+        self,
+        domain: str,
+        time_slice: TimeSlice,
+        search_type: str,
+        total: int,
+        start_page: int = 1,
+    ) -> AsyncIterator[SearchResult]:
+        """
+        Yield parsed results page by page.
         
-        page = 1
-        max_pages = self.GITHUB_MAX_RESULTS // self.per_page
+        The last page is planned from the known total, so every page
+        request is queued up front (paced by the rate limiter, and sharing
+        the engine's max_concurrency search slots) instead of discovering
+        the end one round-trip at a time. Results are still
+        yielded in page order.
         
-        while page <= max_pages:
-            if self.state.interrupted:
-                return
-            
-            params = {
-                "q": query,
-                "per_page": self.per_page,
-                "page": page,
-                "sort": "indexed",
-                "order": "desc",
-            }
-            
-            response = self._make_request(endpoint, params)
-            
-            if not response or response.status_code != 200:
-                break
-            
-            data = response.json()
-            items = data.get("items", [])
-            
-            if not items:
-                break
-            
-            # Process results
-            for item in items:
-                result = self._parse_result(item, search_type)
-                if result and self.state.add_result(result):
-                    self.output.add_result(result)
+        Args:
+            domain: Target domain.
+            time_slice: Time slice.
+            search_type: Search type.
+            total: Total result count reported by the first page.
+            start_page: First page to fetch.
             
-            # Check if more pages
-            total = data.get("total_count", 0)
-            if page * self.per_page >= total or page * self.per_page >= self.GITHUB_MAX_RESULTS:
-                break
+        Yields:
+            Parsed SearchResult objects.
+        """
+        reachable = min(total, self.GITHUB_MAX_RESULTS)
+        last_page = min(self._max_pages, -(-reachable // self.per_page))
+        
+        base_params = {
+            "q": self._build_query(time_slice),
+            "per_page": self.per_page,
+            "sort": "indexed",
+            "order": "desc",
+        }
+        pages = [
+            asyncio.create_task(
+                self._search_page(search_type, {**base_params, "page": page})
+            )
+            for page in range(start_page, last_page + 1)
+        ]
+        
+        try:
+            for page in pages:
+                data = await page
+                if self.state.interrupted:
+                    return
+                if data is None:
+                    continue
+                
+                for item in data.get("items", []):
+                    result = self._parse_result(item, search_type)
+                    if result:
+                        yield result
+        finally:
+            for page in pages:
+                page.cancel()
+    
+    async def _search_page(
+        self,
+        search_type: str,
+        params: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of search results, revalidating by ETag.
+        
+        If the same page was fetched before, If-None-Match is sent and a
+        304 reuses the cached body; GitHub does not count 304s against
+        the rate limit.
+        
+        Args:
+            search_type: Search type.
+            params: Query parameters (q, page, ...).
             
-            page += 1
+        Returns:
+            Parsed response body, or None on failure.
+        """
+        endpoint = f"{self.api_base}/search/{search_type}"
+        cache_key = (search_type, params["q"], params["page"])
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        
+        # Held only around the request, never while awaiting other pages
+        async with self._search_slots:
+            response = await self._make_request(endpoint, params, headers)
+        
+        if not response:
+            return None
+        
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(cache_key)
+            return cached[1]
+        
+        if response.status_code != 200:
+            return None
+        
+        data = json_loads(response.content)
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[cache_key] = (etag, data)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        
+        return data
     
-    def _build_query(self, domain: str, time_slice: TimeSlice) -> str:
+    def _build_query(self, time_slice: TimeSlice) -> str:
         """
-        Build GitHub search query string.
+        Build GitHub search query string for the current domain.
         
         Args:
-            domain: Target domain.
             time_slice: Time slice.
             
         Returns:
             Formatted query string.
         """
-        # Quote the domain for exact match
-        query = f'"{domain}"'
-        
-        # Add date range
+        # Add date range to the pre-quoted domain
         if time_slice.start_date == time_slice.end_date:
-            query += f" created:{time_slice.start_date}"
-        else:
-            query += f" created:{time_slice.start_date}..{time_slice.end_date}"
-        
-        return query
+            return f"{self._domain_q} created:{time_slice.start_date}"
+        return f"{self._domain_q} created:{time_slice.start_date}..{time_slice.end_date}"
     
-    def _make_request(
+    async def _make_request(
         self,
         endpoint: str,
         params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
     ) -> Optional[Any]:
         """
-        Make an API request with rate limit handling.
+        Make an API request, sharing identical concurrent requests.
+        
+        Engines searching in parallel can ask for the same page at the
+        same time; HttpClient.dedup() sends it once for all of them.
         
         Args:
             endpoint: API endpoint.
             params: Query parameters.
+            headers: Extra request headers (e.g. If-None-Match).
             
         Returns:
             Response object or None on failure.
         """
-        # Ensure we have a valid token
-        self.auth.get_best_token()
+        key = (
+            endpoint,
+            tuple(sorted(params.items())),
+            tuple(sorted(headers.items())) if headers else (),
+        )
+        return await self.http.dedup(
+            key, lambda: self._send_request(endpoint, params, headers)
+        )
+    
+    async def _send_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[Any]:
+        """
+        Make an API request with rate limit handling.
         
-        # Check rate limit
-        self.rate_limiter.check_and_wait()
+        Rate limit and abuse responses are retried up to MAX_ATTEMPTS
+        times; AuthManager decides the wait, and abuse retries back off
+        with growing decorrelated jitter. Cooldowns are waited out once,
+        by the shared limiter's acheck_and_wait(), which holds back every
+        worker meanwhile.
         
-        try:
-            response = self.http.get(
-                endpoint,
-                headers=self.auth.get_auth_header(),
-                params=params,
-            )
+        Args:
+            endpoint: API endpoint.
+            params: Query parameters.
+            headers: Extra request headers (e.g. If-None-Match).
             
-            # Update rate limit info
-            self.rate_limiter.update_from_headers(dict(response.headers))
-            self.auth.update_from_response(response)
+        Returns:
+            Response object or None on failure.
+        """
+        for _ in range(self.MAX_ATTEMPTS):
+            # Ensure we have a valid token; keep it, since other workers
+            # may switch the current token while this request is pending
+            token = await self.auth.aget_best_token()
             
-            # Handle rate limit errors
-            if response.status_code == 403:
-                if "rate limit" in response.text.lower():
-                    logger.warning("Rate limit hit, rotating token...")
-                    self.auth.handle_rate_limit_error(response)
-                    return self._make_request(endpoint, params)  # Retry
-                elif "abuse" in response.text.lower():
-                    logger.warning("Abuse detection! Sleeping...")
-                    time.sleep(self.abuse_sleep)
-                    return self._make_request(endpoint, params)
+            # Check rate limit
+            await self.rate_limiter.acheck_and_wait()
+            await self.rate_limiter.acquire(key=token.token)
             
-            elif response.status_code == 422:
-                # Validation error (e.g., query too long)
-                logger.error(f"Validation error: {response.text}")
-                return None
+            request_headers = token.auth_header
+            if headers:
+                request_headers = {**request_headers, **headers}
             
-            return response
+            try:
+                response = await self.http.get(
+                    endpoint,
+                    headers=request_headers,
+                    params=params,
+                )
+                
+                # Update rate limit info
+                self.rate_limiter.update_from_headers(response.headers, token.token)
+                self.auth.update_from_response(response, token)
+                
+                # Handle rate limit errors
+                if response.status_code == 403:
+                    reason = self._classify_forbidden(response)
+                    if reason is not None:
+                        if reason == "rate_limit":
+                            logger.warning("Rate limit hit, rotating token...")
+                        else:
+                            logger.warning("Abuse detection! Backing off...")
+                        cooldown = self.auth.record_rate_limit_error(response, token)
+                        if cooldown is not None:
+                            self.rate_limiter.defer(*cooldown)
+                        continue
+                
+                elif response.status_code == 422:
+                    # Validation error (e.g., query too long)
+                    logger.error(f"Validation error: {response.text}")
+                    return None
+                
+                return response
+                
+            except Exception as e:
+                logger.error(f"Request failed: {e}")
+                return None
+        
+        logger.error(f"Giving up on {endpoint} after {self.MAX_ATTEMPTS} attempts")
+        return None
+    
+    def _classify_forbidden(self, response: Any) -> Optional[str]:
+        """
+        Work out why GitHub answered 403, preferring headers over the body.
+        
+        Primary rate limits report X-RateLimit-Remaining: 0; secondary
+        (abuse) limits send Retry-After. The error message is only read
+        when neither header settles it.
+        
+        Args:
+            response: 403 response.
             
-        except Exception as e:
-            logger.error(f"Request failed: {e}")
-            return None
+        Returns:
+            "rate_limit", "abuse", or None for other 403s.
+        """
+        headers = response.headers
+        if headers.get("X-RateLimit-Remaining") == "0":
+            return "rate_limit"
+        if "Retry-After" in headers:
+            return "abuse"
+        
+        # Secondary limit messages also mention "rate limit", check first
+        message = api_error_message(response)
+        if "abuse" in message or "secondary" in message:
+            return "abuse"
+        if "rate limit" in message:
+            return "rate_limit"
+        return None
     
     def _parse_result(
         self,
@@ -450,6 +709,10 @@ class SearchEngine:
         """
         Parse a search result item into SearchResult.
         
+        Fields GitHub always returns are read by subscript; an item
+        missing any of them is skipped rather than recorded with
+        placeholder values.
+        
         Args:
             item: Raw API response item.
             search_type: Type of search.
@@ -461,10 +724,10 @@ class SearchEngine:
             if search_type == "repositories":
                 return SearchResult(
                     type="repository",
-                    name=item.get("full_name", item.get("name", "unknown")),
-                    url=item.get("url", ""),
-                    html_url=item.get("html_url", ""),
-                    owner=item.get("owner", {}).get("login", "unknown"),
+                    name=item["full_name"],
+                    url=item["url"],
+                    html_url=item["html_url"],
+                    owner=item["owner"]["login"],
                     created_at=item.get("created_at"),
                     updated_at=item.get("updated_at"),
                     description=item.get("description"),
@@ -472,21 +735,21 @@ class SearchEngine:
                     stars=item.get("stargazers_count", 0),
                     raw_data=item,
                 )
-            else:
-                # Code search result
-                repo = item.get("repository", {})
-                return SearchResult(
-                    type="code",
-                    name=item.get("name", "unknown"),
-                    url=item.get("url", ""),
-                    html_url=item.get("html_url", ""),
-                    owner=repo.get("owner", {}).get("login", "unknown"),
-                    description=repo.get("description"),
-                    language=item.get("language"),
-                    raw_data=item,
-                )
-        except Exception as e:
-            logger.warning(f"Failed to parse result: {e}")
+            
+            # Code search result
+            repo = item["repository"]
+            return SearchResult(
+                type="code",
+                name=item["name"],
+                url=item["url"],
+                html_url=item["html_url"],
+                owner=repo["owner"]["login"],
+                description=repo.get("description"),
+                language=item.get("language"),
+                raw_data=item,
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Failed to parse result: missing {e}")
             return None
 
 
@@ -495,7 +758,8 @@ class GistSearchEngine:
     Separate engine for searching GitHub Gists.
     
     GitHub Gists have a different search mechanism and are accessed
-    via gist.github.com rather than the main API.
+    via gist.github.com rather than the main API. Page fetches are paced
+    by their own token bucket, separate from the search API quota.
     """
     
     GIST_SEARCH_URL = "https://gist.github.com/search"
@@ -505,6 +769,7 @@ class GistSearchEngine:
         http_client: HttpClient,
         output_manager: OutputManager,
         state: ScanState,
+        rate_limiter: Optional[RateLimiter] = None,
     ):
         """
         Initialize the gist search engine.
@@ -513,12 +778,14 @@ class GistSearchEngine:
             http_client: HTTP client.
             output_manager: Output handler.
             state: Shared scan state.
+            rate_limiter: Limiter pacing page fetches (optional).
         """
         self.http = http_client
         self.output = output_manager
         self.state = state
+        self.rate_limiter = rate_limiter or RateLimiter()
     
-    def search_gists(self, domain: str) -> int:
+    async def search_gists(self, domain: str) -> int:
         """
         Search for gists containing a domain.
         
@@ -544,7 +811,8 @@ class GistSearchEngine:
                 break
             
             try:
-                response = self.http.get(
+                await self.rate_limiter.acquire()
+                response = await self.http.get(
                     self.GIST_SEARCH_URL,
                     params={"q": query, "p": page},
                 )
@@ -591,18 +859,11 @@ class GistSearchEngine:
         """
         gists = []
         
-        # Pattern to match gist links
-        # Format: /username/gist_id
-        pattern = r'href="(/[^/]+/[a-f0-9]{32})"'
-        
-        for match in re.finditer(pattern, html):
-            path = match.group(1)
-            parts = path.strip("/").split("/")
-            if len(parts) == 2:
-                owner = parts[0]
-                gist_id = parts[1]
-                url = f"https://gist.github.com{path}"
-                gists.append((url, gist_id[:12], owner))
+        # The pattern guarantees exactly two path segments
+        for path in _GIST_HREF_RE.findall(html):
+            owner, gist_id = path[1:].split("/", 1)
+            url = f"https://gist.github.com{path}"
+            gists.append((url, gist_id[:12], owner))
         
         return gists
 
@@ -11,10 +11,12 @@ GitHub Rate Limits (from official documentation):
 Reference: https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
 """
 
+import asyncio
+import random
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Hashable, Mapping, Optional, Tuple
 
 from ..utils import logger
 
@@ -62,11 +64,28 @@ class RateLimitState:
         return datetime.now()
 
 
+@dataclass
+class _Bucket:
+    """
+    Token bucket level for one key (one API token).
+    
+    Attributes:
+        tokens: Requests currently available.
+        last_refill: Monotonic time of the last refill.
+        lock: Serves this key's callers in order.
+    """
+    tokens: float
+    last_refill: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
 class RateLimiter:
     """
     Rate limiter for GitHub API requests.
     
     Implements proactive rate limit monitoring as recommended by GitHub:
+    - Pace requests with a token bucket per API token, refilled at the
+      search rate, so every token adds its own quota
     - Monitor x-ratelimit-remaining BEFORE hitting limits
     - Respect Retry-After header on 403/429 errors
     - Use exponential backoff when no Retry-After provided
@@ -98,6 +117,9 @@ class RateLimiter:
     MAX_CONCURRENT_REQUESTS = 100
     BURST_LIMIT_REST = 900               # points per minute (unofficial)
     
+    # Max random seconds added to exponential backoff waits
+    BACKOFF_JITTER = 5
+    
     def __init__(self, min_remaining: int = 2, backoff_base: int = 60):
         """
         Initialize the rate limiter.
@@ -111,42 +133,134 @@ class RateLimiter:
         self.backoff_base = backoff_base
         self._last_request_time: float = 0
         self._consecutive_errors: int = 0
+        
+        # Base delay between requests per resource
+        # Search: 30 requests per 60 seconds = 1 request per 2 seconds
+        # Core API is much more lenient
+        self._delays = {
+            "search": self.SEARCH_WINDOW / self.SEARCH_LIMIT_AUTHENTICATED,
+            "core": 0.5,
+        }
+        
+        # Token buckets per key: refill continuously at limit/window tokens
+        # per second; key None is used by callers without a token
+        self._capacity: float = float(self.SEARCH_LIMIT_AUTHENTICATED)
+        self._rate: float = self.SEARCH_LIMIT_AUTHENTICATED / self.SEARCH_WINDOW
+        self._buckets: Dict[Hashable, _Bucket] = {}
+        # Serializes async cooldowns so only one countdown display runs
+        self._wait_lock = asyncio.Lock()
+        self._cooldown_message = "Retry-After cooldown"
+    
+    def _bucket(self, key: Hashable) -> _Bucket:
+        """Get the bucket for a key, starting it full."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self._capacity)
+        return bucket
     
-    def update_from_headers(self, headers: dict) -> None:
+    def _refill(self, bucket: _Bucket) -> None:
+        """Add tokens earned since the last refill, up to capacity."""
+        now = time.monotonic()
+        bucket.tokens = min(
+            self._capacity,
+            bucket.tokens + (now - bucket.last_refill) * self._rate,
+        )
+        bucket.last_refill = now
+    
+    async def acquire(self, n: int = 1, key: Hashable = None) -> None:
+        """
+        Take n tokens from a key's bucket, sleeping until they are available.
+        
+        Concurrent callers of one key are served in order, so its request
+        rate converges on the search limit instead of bursting and then
+        stalling until the window resets. Keys don't wait for each other.
+        
+        Args:
+            n: Number of tokens (requests) to take.
+            key: Bucket to take from, e.g. the API token sending the request.
+        """
+        bucket = self._bucket(key)
+        async with bucket.lock:
+            self._refill(bucket)
+            if bucket.tokens < n:
+                await asyncio.sleep((n - bucket.tokens) / self._rate)
+                self._refill(bucket)
+            bucket.tokens -= n
+    
+    def update_from_headers(
+        self,
+        headers: Mapping[str, str],
+        key: Hashable = None,
+    ) -> None:
         """
         Update rate limit state from response headers.
         
         CRITICAL: Always monitor these headers proactively!
         Don't wait for 403 errors to check limits.
         
+        The server's remaining count is authoritative, so it also resets
+        the level of the key's bucket. For keyed responses the count only
+        touches that bucket: other tokens keep their own quota, and
+        AuthManager handles exhaustion per token.
+        
         Args:
-            headers: Response headers dictionary.
+            headers: Response headers. Pass the response's case-insensitive
+                mapping as-is; GitHub sends these names in lowercase.
+            key: Bucket the request was charged to (see acquire()).
         """
         try:
             # Standard rate limit headers
-            if "X-RateLimit-Remaining" in headers:
-                self.state.remaining = int(headers["X-RateLimit-Remaining"])
-            if "X-RateLimit-Limit" in headers:
-                self.state.limit = int(headers["X-RateLimit-Limit"])
-            if "X-RateLimit-Reset" in headers:
-                self.state.reset_time = int(headers["X-RateLimit-Reset"])
-            if "X-RateLimit-Used" in headers:
-                self.state.used = int(headers["X-RateLimit-Used"])
-            if "X-RateLimit-Resource" in headers:
-                self.state.resource = headers["X-RateLimit-Resource"]
+            remaining = headers.get("X-RateLimit-Remaining")
+            limit = headers.get("X-RateLimit-Limit")
+            reset_time = headers.get("X-RateLimit-Reset")
+            used = headers.get("X-RateLimit-Used")
+            resource = headers.get("X-RateLimit-Resource")
+            retry_after = headers.get("Retry-After")
+            
+            if key is None:
+                if remaining is not None:
+                    self.state.remaining = int(remaining)
+                if reset_time is not None:
+                    self.state.reset_time = int(reset_time)
+            if limit is not None:
+                self.state.limit = int(limit)
+            if used is not None:
+                self.state.used = int(used)
+            if resource is not None:
+                self.state.resource = resource
             
-            # Retry-After header (critical for 403/429 responses)
-            if "Retry-After" in headers:
-                self.state.retry_after = int(headers["Retry-After"])
-            else:
-                self.state.retry_after = None
-                
-            # Reset error counter on successful header parse
-            self._consecutive_errors = 0
+            if remaining is not None:
+                bucket = self._bucket(key)
+                self._refill(bucket)
+                bucket.tokens = min(self._capacity, float(remaining))
+            if limit is not None and self.state.resource == "search":
+                self._capacity = float(self.state.limit)
+                self._rate = self.state.limit / self.SEARCH_WINDOW
+            
+            # Retry-After header (critical for 403/429 responses); kept
+            # until a cooldown consumes it, whatever later responses say
+            if retry_after is not None:
+                self.defer(int(retry_after), "Retry-After cooldown")
             
         except (ValueError, TypeError) as e:
             logger.warning(f"Error parsing rate limit headers: {e}")
     
+    def defer(self, seconds: int, message: str) -> None:
+        """
+        Schedule a cooldown for the next check_and_wait() to wait out.
+        
+        Overlapping cooldowns merge into the longest one, so a Retry-After
+        seen by several workers (or recorded both from headers and by a
+        backoff decision) is waited out once.
+        
+        Args:
+            seconds: Cooldown length.
+            message: Message shown during the countdown.
+        """
+        if seconds > (self.state.retry_after or 0):
+            self.state.retry_after = seconds
+            self._cooldown_message = message
+    
     def check_and_wait(self) -> bool:
         """
         Proactively check rate limit and wait if necessary.
@@ -157,14 +271,40 @@ class RateLimiter:
         Returns:
             True if can proceed, False if should abort.
         """
-        # If we have a Retry-After from previous error, respect it
+        cooldown = self._plan_cooldown()
+        if cooldown is not None:
+            logger.countdown(*cooldown)
+        return True
+    
+    async def acheck_and_wait(self) -> bool:
+        """
+        Async variant of check_and_wait().
+        
+        Concurrent callers queue on a lock; whoever cools down first
+        clears the state, so the rest proceed without waiting again.
+        
+        Returns:
+            True if can proceed, False if should abort.
+        """
+        async with self._wait_lock:
+            cooldown = self._plan_cooldown()
+            if cooldown is not None:
+                await logger.acountdown(*cooldown)
+        return True
+    
+    def _plan_cooldown(self) -> Optional[Tuple[int, str]]:
+        """
+        Work out whether a cooldown is due, and consume its state.
+        
+        Returns:
+            (seconds, message) to count down, or None to proceed.
+        """
+        # If we have a Retry-After (or deferred backoff), respect it
         if self.state.retry_after:
-            logger.warning(
-                f"Retry-After header present. Waiting {self.state.retry_after}s..."
-            )
-            logger.countdown(self.state.retry_after, "Retry-After cooldown")
+            logger.warning(f"Cooling down. Waiting {self.state.retry_after}s...")
+            wait_time = self.state.retry_after
             self.state.retry_after = None
-            return True
+            return wait_time, self._cooldown_message
         
         # Proactive check: don't wait until remaining = 0
         if self.state.remaining <= self.min_remaining:
@@ -174,12 +314,11 @@ class RateLimiter:
                     f"Rate limit low ({self.state.remaining} remaining). "
                     f"Waiting {wait_time}s until reset..."
                 )
-                logger.countdown(wait_time + 2, "Rate limit cooldown")
-                # Reset state after waiting
+                # Reset state now; the caller waits out the window
                 self.state.remaining = self.state.limit
-            return True
+                return wait_time + 2, "Rate limit cooldown"
         
-        return True
+        return None
     
     def handle_rate_limit_response(self, status_code: int, headers: dict) -> int:
         """
@@ -187,7 +326,8 @@ class RateLimiter:
         
         Implements GitHub's recommended retry strategy:
         1. If Retry-After header present, wait exactly that time
-        2. Otherwise, use exponential backoff starting at 60s
+        2. Otherwise, use exponential backoff starting at 60s, plus up
+           to BACKOFF_JITTER seconds so retries don't synchronize
         
         Args:
             status_code: HTTP status code (403 or 429).
@@ -209,6 +349,7 @@ class RateLimiter:
         # Base: 60s, then 120s, 240s, etc.
         wait_time = self.backoff_base * (2 ** (self._consecutive_errors - 1))
         wait_time = min(wait_time, 3600)  # Cap at 1 hour
+        wait_time += random.randint(0, self.BACKOFF_JITTER)
         
         logger.warning(
             f"Rate limited (no Retry-After). "
@@ -216,6 +357,10 @@ class RateLimiter:
         )
         return wait_time
     
+    def reset_backoff(self) -> None:
+        """Reset the exponential backoff after a successful response."""
+        self._consecutive_errors = 0
+    
     def can_make_request(self) -> bool:
         """
         Check if a request can be made without waiting.
@@ -251,17 +396,10 @@ class RateLimiter:
         Calculate optimal delay to stay within rate limits.
         
         For Search API (30 req/min), optimal is ~2s between requests.
-        Adding jitter helps avoid synchronized request patterns.
+        Adding jitter (±10%) helps avoid synchronized request patterns.
         
         Returns:
             Recommended delay in seconds.
         """
-        if self.state.resource == "search":
-            # 30 requests per 60 seconds = 1 request per 2 seconds
-            base_delay = self.SEARCH_WINDOW / self.SEARCH_LIMIT_AUTHENTICATED
-        else:
-            # Core API is much more lenient
-            base_delay = 0.5
-        
-        return base_delay
+        return self._delays.get(self.state.resource, 0.5) * random.uniform(0.9, 1.1)
 
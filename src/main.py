@@ -8,26 +8,39 @@ designed to work with TruffleHog for credential scanning.
 Author: @W4R
 """
 
+from __future__ import annotations
+
 import argparse
+import asyncio
+import socket
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_TOKENS_DIR = _PROJECT_ROOT / "config" / "tokens"
 
 # Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(_PROJECT_ROOT))
 
-from src.core.engine import GistSearchEngine, SearchEngine
-from src.managers.auth_manager import AuthManager
-from src.managers.output_manager import OutputManager
 from src.utils import logger
 from src.utils.helpers import (
     ScanState,
+    group_domains,
     load_config,
     parse_year_range,
+    quote_domains,
     setup_signal_handlers,
-    validate_domain,
 )
-from src.utils.http_client import HttpClient
+
+# Engines, managers and the HTTP client pull in httpx; they are
+# imported once a scan is actually going to run, so -h and argument
+# errors return quickly
+if TYPE_CHECKING:
+    from src.managers.auth_manager import AuthManager
+    from src.managers.output_manager import OutputManager
+    from src.utils.http_client import HttpClient
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -56,15 +69,16 @@ For more info: https://github.com/trufflesecurity/trufflehog
         """,
     )
     
-    # Query arguments (one required)
-    parser.add_argument(
+    # Query arguments (one required unless updating)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument(
         "-q", "--query",
         type=str,
         required=False,
         help="Domain or search query (e.g., example.com, filename:password)",
     )
     
-    parser.add_argument(
+    target.add_argument(
         "-l", "--list",
         type=str,
         required=False,
@@ -95,19 +109,20 @@ For more info: https://github.com/trufflesecurity/trufflehog
         help="Year range to search (e.g., '2020-2024' or '2023'). Default: 2015-current",
     )
     
-    parser.add_argument(
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument(
         "--repos-only",
         action="store_true",
         help="Search only repositories (skip gists)",
     )
     
-    parser.add_argument(
+    scope.add_argument(
         "--gists-only",
         action="store_true",
         help="Search only gists (skip repositories)",
     )
     
-    parser.add_argument(
+    scope.add_argument(
         "--code-only",
         action="store_true",
         help="Search only code (skip repository metadata search)",
@@ -133,13 +148,15 @@ For more info: https://github.com/trufflesecurity/trufflehog
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
-        help="Enable verbose output",
+        help="Enable verbose output (overrides TRUFFLEPIGGIE_LOG_LEVEL)",
     )
     
     parser.add_argument(
         "--no-banner",
         action="store_true",
-        help="Don't display ASCII art banner",
+        # Piped or redirected output gets no banner by default
+        default=not sys.stdout.isatty(),
+        help="Don't display ASCII art banner (implied when output is not a terminal)",
     )
     
     # TruffleHog integration
@@ -159,6 +176,29 @@ For more info: https://github.com/trufflesecurity/trufflehog
     return parser
 
 
+def iter_domains(filepath: str) -> Iterator[str]:
+    """
+    Stream domains from a file (one per line).
+    
+    Duplicates are dropped, keeping the first occurrence, since each
+    one would cost a full search.
+    
+    Args:
+        filepath: Path to file containing domains.
+        
+    Yields:
+        Unique domains in file order.
+    """
+    seen = set()
+    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            # Skip empty lines, comments and repeats
+            if line and not line.startswith("#") and line not in seen:
+                seen.add(line)
+                yield line
+
+
 def load_domains_from_file(filepath: str) -> list[str]:
     """
     Load domains from a file (one per line).
@@ -167,20 +207,12 @@ def load_domains_from_file(filepath: str) -> list[str]:
         filepath: Path to file containing domains.
         
     Returns:
-        List of domains.
+        List of unique domains in file order.
     """
-    domains = []
-    path = Path(filepath)
-    
-    if not path.exists():
+    if not Path(filepath).exists():
         raise FileNotFoundError(f"Domain list file not found: {filepath}")
     
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            # Skip empty lines and comments
-            if line and not line.startswith("#"):
-                domains.append(line)
+    domains = list(iter_domains(filepath))
     
     if not domains:
         raise ValueError(f"No valid domains found in: {filepath}")
@@ -188,6 +220,143 @@ def load_domains_from_file(filepath: str) -> list[str]:
     return domains
 
 
+async def scan_domains(
+    auth_manager: AuthManager,
+    http_client: HttpClient,
+    output_manager: OutputManager,
+    config: dict,
+    state: ScanState,
+    domains: list[str],
+    start_year: int,
+    end_year: int,
+    search_repos: bool,
+    search_code: bool,
+    search_gists: bool,
+    interrupt_sock: Optional[socket.socket] = None,
+) -> ScanState:
+    """
+    Scan domains concurrently on a single event loop.
+    
+    Domains are packed into OR queries of up to
+    ``search.domains_per_query`` each, and up to ``network.concurrency``
+    of these groups are in flight at once. Their engines share one rate
+    limiter, which paces requests against the API quota in place of a
+    fixed pause between domains. Gist search has no OR, so it still
+    runs once per domain.
+    
+    Args:
+        auth_manager: Token manager.
+        http_client: Shared HTTP client (closed when done).
+        output_manager: Output handler.
+        config: Configuration dictionary.
+        state: Shared scan state.
+        domains: Domains to scan.
+        start_year: Start year for search range.
+        end_year: End year for search range.
+        search_repos: Whether to search repositories.
+        search_code: Whether to search code.
+        search_gists: Whether to search gists.
+        interrupt_sock: Socket from setup_signal_handlers(); the
+            interrupt notice is logged when it becomes readable.
+        
+    Returns:
+        Final scan state.
+    """
+    from src.core.engine import GistSearchEngine, SearchEngine
+    from src.core.rate_limiter import RateLimiter
+    
+    concurrency = max(1, config.get("network", {}).get("concurrency", 3))
+    rate_limiter = RateLimiter(
+        backoff_base=config.get("network", {}).get("abuse_sleep", 60)
+    )
+    progress = logger.create_progress()
+    
+    groups = group_domains(
+        domains,
+        max_terms=max(1, config.get("search", {}).get("domains_per_query", 5)),
+    )
+    
+    # Runners pull the next group from one shared iterator, so only
+    # `concurrency` coroutines exist however long the list is
+    pending = enumerate(groups)
+    
+    # Gist scraping keeps no per-domain state, so one engine serves all
+    gist_engine = GistSearchEngine(
+        http_client=http_client,
+        output_manager=output_manager,
+        state=state,
+    )
+    
+    async def run_domains(engine: SearchEngine) -> None:
+        for idx, group in pending:
+            if state.interrupted:
+                break
+            
+            label = ", ".join(group)
+            
+            # Show progress for multiple domains
+            if len(domains) > 1:
+                logger.highlight(f"[{idx + 1}/{len(groups)}] Scanning: {label}")
+            
+            # Run main search for the whole group
+            await engine.search_domain(
+                domain=label,
+                start_year=start_year,
+                end_year=end_year,
+                search_repos=search_repos,
+                search_gists=search_code,
+                progress=progress,
+                query=quote_domains(group),
+            )
+            
+            # Search gists separately if requested
+            for domain in group:
+                if not search_gists or state.interrupted:
+                    break
+                await gist_engine.search_gists(domain)
+    
+    # One engine per runner, reused for every domain it picks up
+    engines = []
+    for _ in range(min(concurrency, len(groups))):
+        engine = SearchEngine(
+            auth_manager=auth_manager,
+            http_client=http_client,
+            output_manager=output_manager,
+            config=config,
+            rate_limiter=rate_limiter,
+        )
+        engine.state = state
+        engines.append(engine)
+    
+    async def announce_interrupt(sock: socket.socket) -> None:
+        # Logs from the loop, never from inside the signal handler
+        await asyncio.get_running_loop().sock_recv(sock, 64)
+        logger.warning("\nInterrupt received! Saving current progress...")
+    
+    watcher = (
+        asyncio.create_task(announce_interrupt(interrupt_sock))
+        if interrupt_sock is not None
+        else None
+    )
+    
+    # Handshake with the API host while the first requests are still pacing
+    warm_up = asyncio.create_task(
+        http_client.warm_up(config.get("github", {}).get("api_base", "https://api.github.com"))
+    )
+    
+    try:
+        with progress:
+            await asyncio.gather(*(run_domains(engine) for engine in engines))
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        warm_up.cancel()
+        await http_client.close()
+        auth_manager.close()
+    
+    return state
+
+
 def update_tool() -> int:
     """
     Update TrufflePiggie from git while preserving tokens.
@@ -199,8 +368,8 @@ def update_tool() -> int:
     import shutil
     import tempfile
     
-    project_root = Path(__file__).parent.parent
-    tokens_dir = project_root / "config" / "tokens"
+    project_root = _PROJECT_ROOT
+    tokens_dir = _TOKENS_DIR
     
     logger.info("🔄 Updating TrufflePiggie...")
     
@@ -265,6 +434,9 @@ def main() -> int:
     parser = create_parser()
     args = parser.parse_args()
     
+    if args.verbose:
+        logger.set_level("info")
+    
     # Handle update command
     if args.update:
         logger.print_banner()
@@ -275,17 +447,17 @@ def main() -> int:
         logger.print_banner()
     
     # Load configuration
-    config = load_config()
+    try:
+        config = load_config()
+    except ImportError as e:
+        logger.error(str(e))
+        return 1
     
-    # Validate that either -q or -l is provided
+    # Validate that either -q or -l is provided (argparse rejects both)
     if not args.query and not args.list:
         logger.error("You must provide either -q/--query or -l/--list")
         return 1
     
-    if args.query and args.list:
-        logger.error("Use either -q/--query or -l/--list, not both")
-        return 1
-    
     # Get list of domains to process
     try:
         if args.list:
@@ -335,12 +507,22 @@ def main() -> int:
     logger.info(f"Year range: {start_year} - {end_year}")
     logger.info(f"Output format: {args.format}")
     
+    from src.managers.auth_manager import AuthManager
+    from src.managers.output_manager import OutputManager
+    from src.utils.http_client import HttpClient
+    
     # Initialize HTTP client
     http_client = HttpClient(
         min_delay=config.get("network", {}).get("min_delay", 2.0),
         max_delay=config.get("network", {}).get("max_delay", 5.5),
         timeout=config.get("network", {}).get("timeout", 15),
         max_retries=config.get("network", {}).get("max_retries", 3),
+        # One connection per concurrent search, shared by all domain groups
+        max_connections=max(
+            HttpClient.MAX_CONNECTIONS,
+            config.get("network", {}).get("concurrency", 3)
+            * config.get("search", {}).get("max_concurrency", 5),
+        ),
     )
     
     # Set custom delay if provided
@@ -350,15 +532,13 @@ def main() -> int:
     # Initialize authentication
     try:
         if args.token:
-            # Create temporary token file
-            tokens_dir = Path(__file__).parent.parent / "config" / "tokens"
-            tokens_dir.mkdir(parents=True, exist_ok=True)
-            temp_token_file = tokens_dir / "_temp_token.txt"
-            with open(temp_token_file, "w") as f:
-                f.write(args.token)
-            auth_manager = AuthManager(tokens_dir=tokens_dir)
+            # Keep the token in memory rather than writing it to disk
+            auth_manager = AuthManager(tokens=[args.token])
         else:
             auth_manager = AuthManager()
+        
+        # Learn every token's real quota (and drop revoked ones) up front
+        auth_manager.refresh_all()
     except ValueError as e:
         logger.error(str(e))
         logger.info("To get a GitHub token:")
@@ -378,7 +558,7 @@ def main() -> int:
     
     # Create scan state and setup signal handlers
     state = ScanState()
-    setup_signal_handlers(state)
+    interrupt_sock = setup_signal_handlers(state)
     
     # Determine what to search
     search_repos = not args.gists_only and not args.code_only
@@ -386,50 +566,21 @@ def main() -> int:
     search_gists = not args.repos_only and not args.code_only
     
     try:
-        # Initialize search engine
-        engine = SearchEngine(
+        # Process domains
+        state = asyncio.run(scan_domains(
             auth_manager=auth_manager,
             http_client=http_client,
             output_manager=output_manager,
             config=config,
-        )
-        engine.state = state
-        
-        # Process each domain
-        for idx, domain in enumerate(domains):
-            if state.interrupted:
-                break
-            
-            # Show progress for multiple domains
-            if len(domains) > 1:
-                logger.info("")
-                logger.highlight(f"[{idx + 1}/{len(domains)}] Scanning: {domain}")
-            
-            # Run main search for this domain
-            state = engine.search_domain(
-                domain=domain,
-                start_year=start_year,
-                end_year=end_year,
-                search_repos=search_repos,
-                search_gists=search_code,
-            )
-            
-            # Search gists separately if requested
-            if search_gists and not state.interrupted:
-                gist_engine = GistSearchEngine(
-                    http_client=http_client,
-                    output_manager=output_manager,
-                    state=state,
-                )
-                gist_engine.search_gists(domain)
-            
-            # Brief pause between domains to respect rate limits
-            if len(domains) > 1 and idx < len(domains) - 1 and not state.interrupted:
-                import time
-                import random
-                wait_time = random.uniform(2.0, 5.0)
-                logger.info(f"Waiting {wait_time:.1f}s before next domain (rate limit protection)...")
-                time.sleep(wait_time)
+            state=state,
+            domains=domains,
+            start_year=start_year,
+            end_year=end_year,
+            search_repos=search_repos,
+            search_code=search_code,
+            search_gists=search_gists,
+            interrupt_sock=interrupt_sock,
+        ))
         
         # Finalize output
         output_files = output_manager.finalize(
@@ -478,8 +629,6 @@ def main() -> int:
             import traceback
             traceback.print_exc()
         return 1
-    finally:
-        http_client.close()
 
 
 if __name__ == "__main__":
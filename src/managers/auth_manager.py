@@ -12,21 +12,74 @@ Multiple tokens from same user share the same quota.
 Reference: https://docs.github.com/en/rest/using-the-rest-api/rate-limits-for-the-rest-api
 """
 
+import asyncio
+import math
+import random
 import re
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from itertools import cycle
+from functools import lru_cache
+from heapq import heapify
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import requests
+import httpx
 
 from ..utils import logger
-from ..utils.helpers import mask_token
+from ..utils.helpers import api_error_message, json_loads, mask_token
 
+# Bodies of classic (ghp_) and fine-grained (github_pat_) access tokens
+_GHP_BODY = re.compile(r'[a-zA-Z0-9]{36,}')
+_PAT_BODY = re.compile(r'[a-zA-Z0-9_]{22,}')
 
-@dataclass
+
+# Token files: whole lines holding one token, and lines holding anything
+# other than a comment; both scanned over the full text in one call each
+_TOKEN_LINE_RE = re.compile(
+    rf'^[ \t]*(ghp_{_GHP_BODY.pattern}|github_pat_{_PAT_BODY.pattern})[ \t]*$',
+    re.MULTILINE,
+)
+_ENTRY_LINE_RE = re.compile(r'^[ \t]*[^\s#]', re.MULTILINE)
+
+
+def _is_token(token: str) -> bool:
+    """Check whether a string looks like a GitHub personal access token."""
+    if token.startswith("ghp_"):
+        return _GHP_BODY.fullmatch(token, 4) is not None
+    if token.startswith("github_pat_"):
+        return _PAT_BODY.fullmatch(token, 11) is not None
+    return False
+
+
+def _header_int(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a numeric rate limit header value.
+    
+    Args:
+        value: Raw header value, or None if the header was absent.
+        
+    Returns:
+        The integer value, or None if absent or malformed.
+    """
+    if value is None:
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _fmt_hms(timestamp: int) -> str:
+    """Format a reset timestamp as local HH:MM:SS."""
+    return datetime.fromtimestamp(timestamp).strftime("%H:%M:%S")
+
+
+@dataclass(slots=True)
 class TokenInfo:
     """
     Information about a GitHub API token.
@@ -43,6 +96,7 @@ class TokenInfo:
         reset_time: Unix timestamp when rate limit resets.
         is_valid: Whether the token is valid.
         resource: API resource type being tracked.
+        checked_at: Monotonic time the counters were last refreshed.
     """
     token: str
     remaining: int = 30  # GitHub search API limit per minute
@@ -50,11 +104,24 @@ class TokenInfo:
     is_valid: bool = True
     resource: str = "search"
     retry_after: Optional[int] = None
+    checked_at: float = 0.0
+    _masked: str = field(init=False, repr=False, compare=False)
+    _auth_header: Dict[str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Token strings never change, so mask and build the header once
+        self._masked = mask_token(self.token)
+        self._auth_header = {"Authorization": f"Bearer {self.token}"}
     
     @property
     def masked(self) -> str:
         """Get masked version of token."""
-        return mask_token(self.token)
+        return self._masked
+    
+    @property
+    def auth_header(self) -> Dict[str, str]:
+        """Get the Authorization header (shared; copy before adding to it)."""
+        return self._auth_header
     
     @property
     def reset_datetime(self) -> datetime:
@@ -73,8 +140,9 @@ class AuthManager:
     """
     Manages GitHub API tokens with automatic rotation and rate limit handling.
     
-    Implements a round-robin rotation strategy with intelligent switching
-    when tokens are exhausted. Monitors the SEARCH API rate limit specifically,
+    Rotates to the token with the most search requests left (ties go to
+    the earliest reset), kept in a heap that is rebuilt only after rate
+    limit counters change. Monitors the SEARCH API rate limit specifically,
     not the core API limit (which is much higher but irrelevant for searches).
     
     CRITICAL: The Search API has a limit of 30 requests/minute (authenticated).
@@ -88,18 +156,22 @@ class AuthManager:
     
     Attributes:
         tokens: List of TokenInfo objects.
-        token_cycle: Cycle iterator for round-robin rotation.
         current_token: Currently active token.
         api_base: GitHub API base URL.
     """
     
     MIN_REMAINING_THRESHOLD = 2  # Switch token when remaining < this
+    RATE_LIMIT_TTL = 10  # Seconds a token's counters are trusted as fresh
     SEARCH_LIMIT_PER_MINUTE = 30  # GitHub Search API limit
+    ABUSE_BACKOFF_BASE = 60.0  # Seconds; GitHub asks for at least a minute
+    ABUSE_BACKOFF_CAP = 900.0  # Seconds; never back off longer than this
+    PROBE_WORKERS = 16  # Concurrent /rate_limit probes in refresh_all()
     
     def __init__(
         self,
         tokens_dir: Optional[Path] = None,
         api_base: str = "https://api.github.com",
+        tokens: Optional[List[str]] = None,
     ):
         """
         Initialize the authentication manager.
@@ -107,20 +179,42 @@ class AuthManager:
         Args:
             tokens_dir: Directory containing token files.
             api_base: GitHub API base URL.
+            tokens: Tokens to use instead of reading tokens_dir.
             
         Raises:
             ValueError: If no valid tokens are found.
         """
         self.api_base = api_base
         self.tokens: List[TokenInfo] = []
-        self._token_cycle: Optional[Iterator[TokenInfo]] = None
         self._current_token: Optional[TokenInfo] = None
         
-        # Load tokens
-        if tokens_dir is None:
-            tokens_dir = Path(__file__).parent.parent.parent / "config" / "tokens"
+        # Valid tokens as (-remaining, reset_time, index); stale once dirty
+        self._heap: List[Tuple[int, int, int]] = []
+        self._heap_dirty = True
         
-        self._load_tokens(tokens_dir)
+        # Last abuse backoff per token string, grown with decorrelated jitter
+        self._backoff: Dict[str, float] = {}
+        
+        # Serializes async waits for a reset across concurrent workers
+        self._wait_lock = asyncio.Lock()
+        
+        # Keep-alive session for /rate_limit probes; all go to one host
+        # (HTTP/2 multiplexes parallel probes over a single connection)
+        self._session = httpx.Client(
+            http2=True,
+            timeout=10,
+            headers={"Accept": "application/vnd.github+json"},
+            limits=httpx.Limits(max_connections=self.PROBE_WORKERS),
+        )
+        
+        # Load tokens
+        if tokens is not None:
+            for token in tokens:
+                self._add_token(token.strip(), "command line")
+        else:
+            if tokens_dir is None:
+                tokens_dir = Path(__file__).parent.parent.parent / "config" / "tokens"
+            self._load_tokens(tokens_dir)
         
         if not self.tokens:
             raise ValueError(
@@ -131,8 +225,7 @@ class AuthManager:
             )
         
         # Initialize rotation
-        self._token_cycle = cycle(self.tokens)
-        self._current_token = next(self._token_cycle)
+        self._current_token = self.tokens[0]
         
         logger.info(f"Loaded {len(self.tokens)} GitHub token(s)")
     
@@ -147,25 +240,38 @@ class AuthManager:
             logger.warning(f"Tokens directory not found: {tokens_dir}")
             return
         
-        # Token patterns
-        token_pattern = re.compile(r'^(ghp_[a-zA-Z0-9]{36,}|github_pat_[a-zA-Z0-9_]{22,})$')
-        
         for token_file in tokens_dir.glob("*.txt"):
             if token_file.name == ".keep":
                 continue
                 
             try:
-                with open(token_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        token = line.strip()
-                        if token and token_pattern.match(token):
-                            self.tokens.append(TokenInfo(token=token))
-                        elif token and not token.startswith("#"):
-                            # Log invalid tokens (but not comments)
-                            logger.warning(f"Invalid token format in {token_file.name}")
+                text = token_file.read_text(encoding="utf-8")
+                found = _TOKEN_LINE_RE.findall(text)
+                self.tokens.extend(TokenInfo(token=token) for token in found)
+                
+                # Blank lines and comments are fine; anything else is not
+                invalid = len(_ENTRY_LINE_RE.findall(text)) - len(found)
+                if invalid:
+                    logger.warning(
+                        f"Invalid token format in {token_file.name} "
+                        f"({invalid} line(s) skipped)"
+                    )
             except Exception as e:
                 logger.error(f"Error reading {token_file}: {e}")
     
+    def _add_token(self, token: str, source: str) -> None:
+        """
+        Add a token if it looks like a GitHub token.
+        
+        Args:
+            token: Stripped token string.
+            source: Where the token came from, for the warning.
+        """
+        if _is_token(token):
+            self.tokens.append(TokenInfo(token=token))
+        else:
+            logger.warning(f"Invalid token format in {source}")
+    
     @property
     def current_token(self) -> TokenInfo:
         """Get the current active token."""
@@ -177,10 +283,13 @@ class AuthManager:
         """
         Get the authorization header for API requests.
         
+        The dictionary is shared by every request made with the current
+        token, so callers must copy it before adding headers.
+        
         Returns:
             Dictionary with Authorization header.
         """
-        return {"Authorization": f"Bearer {self.current_token.token}"}
+        return self.current_token._auth_header
     
     def check_rate_limit(self) -> None:
         """
@@ -194,40 +303,87 @@ class AuthManager:
         - core: 5,000 requests/hour (not relevant for searches)
         
         The /rate_limit endpoint itself doesn't count against limits.
+        Searches never call this: the same numbers arrive in the
+        X-RateLimit-* headers of every response, which
+        update_from_response() records. Use it only to inspect a token
+        before any request has been made.
+        
+        Counters refreshed within RATE_LIMIT_TTL seconds, by a probe or
+        by response headers, are reused without a request.
+        """
+        if time.monotonic() - self.current_token.checked_at < self.RATE_LIMIT_TTL:
+            return
+        
+        self._probe_token(self.current_token)
+        if not self.current_token.is_valid:
+            self._rotate_token()
+    
+    def refresh_all(self) -> None:
+        """
+        Probe /rate_limit for every token at once.
+        
+        Probes are independent and free, so they run on a thread pool
+        and the whole pool costs about one round-trip. Invalid tokens
+        are marked so rotation skips them.
+        
+        Raises:
+            ValueError: If every token was rejected as invalid.
+        """
+        workers = min(self.PROBE_WORKERS, len(self.tokens))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self._probe_token, self.tokens))
+        
+        if not any(token.is_valid for token in self.tokens):
+            raise ValueError("No valid tokens remaining!")
+        
+        if not self.current_token.is_valid:
+            self._rotate_token()
+    
+    def _probe_token(self, token: TokenInfo) -> None:
+        """
+        Refresh one token's search counters from /rate_limit.
+        
+        Args:
+            token: Token to probe.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_base}/rate_limit",
-                headers=self.get_auth_header(),
-                timeout=10,
+                headers=token._auth_header,
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 
                 # CRITICAL: Check the "search" resource specifically!
                 # Don't be fooled by the higher "core" limits
                 search_limit = data.get("resources", {}).get("search", {})
                 
-                self._current_token.remaining = search_limit.get("remaining", 0)
-                self._current_token.reset_time = search_limit.get("reset", 0)
-                self._current_token.resource = "search"
-                self._current_token.is_valid = True
+                token.remaining = search_limit.get("remaining", 0)
+                token.reset_time = search_limit.get("reset", 0)
+                token.resource = "search"
+                token.is_valid = True
+                token.checked_at = time.monotonic()
+                self._heap_dirty = True
                 
                 logger.info(
-                    f"Token {self.current_token.masked}: "
-                    f"{self._current_token.remaining}/30 search requests remaining"
+                    f"Token {token.masked}: "
+                    f"{token.remaining}/30 search requests remaining"
                 )
                 
             elif response.status_code == 401:
-                logger.error(f"Token {self.current_token.masked} is invalid")
-                self._current_token.is_valid = False
-                self._rotate_token()
+                logger.error(f"Token {token.masked} is invalid")
+                token.is_valid = False
+                self._heap_dirty = True
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.warning(f"Failed to check rate limit: {e}")
     
-    def update_from_response(self, response: requests.Response) -> None:
+    def update_from_response(
+        self,
+        response: httpx.Response,
+        token: Optional[TokenInfo] = None,
+    ) -> None:
         """
         Update rate limit info from response headers.
         
@@ -242,42 +398,64 @@ class AuthManager:
         
         Args:
             response: Response object from GitHub API.
+            token: Token the request was sent with (defaults to the
+                current token, which concurrent callers may have changed).
         """
-        try:
-            headers = response.headers
-            
-            remaining = headers.get("X-RateLimit-Remaining")
-            reset_time = headers.get("X-RateLimit-Reset")
-            resource = headers.get("X-RateLimit-Resource")
-            retry_after = headers.get("Retry-After")
-            
-            if remaining is not None:
-                self._current_token.remaining = int(remaining)
-            if reset_time is not None:
-                self._current_token.reset_time = int(reset_time)
-            if resource is not None:
-                self._current_token.resource = resource
-            if retry_after is not None:
-                self._current_token.retry_after = int(retry_after)
-            else:
-                self._current_token.retry_after = None
-                
-        except (ValueError, TypeError):
-            pass
+        headers = response.headers
+        
+        # Responses without rate limit headers carry nothing to update
+        remaining = _header_int(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+        
+        if token is None:
+            token = self._current_token
+        token.remaining = remaining
+        token.checked_at = time.monotonic()
+        # Only a successful response ends an abuse backoff; secondary
+        # limit refusals still report plenty of requests remaining
+        if response.is_success:
+            self._backoff.pop(token.token, None)
+        
+        reset_time = _header_int(headers.get("X-RateLimit-Reset"))
+        if reset_time is not None:
+            token.reset_time = reset_time
+        
+        resource = headers.get("X-RateLimit-Resource")
+        if resource is not None:
+            token.resource = resource
+        
+        token.retry_after = _header_int(headers.get("Retry-After"))
+        self._heap_dirty = True
+    
+    def _pick_token(self) -> Optional[TokenInfo]:
+        """
+        Find the valid token with the most requests left.
+        
+        Returns:
+            The best token, or None if every token is below the
+            switching threshold.
+        """
+        if self._heap_dirty:
+            self._heap = [
+                (-token.remaining, token.reset_time, idx)
+                for idx, token in enumerate(self.tokens)
+                if token.is_valid
+            ]
+            heapify(self._heap)
+            self._heap_dirty = False
+        
+        if self._heap and -self._heap[0][0] >= self.MIN_REMAINING_THRESHOLD:
+            return self.tokens[self._heap[0][2]]
+        return None
     
     def _rotate_token(self) -> None:
-        """Rotate to the next token in the pool."""
-        if self._token_cycle is None:
+        """Rotate to the token with the most requests left."""
+        token = self._pick_token()
+        if token is not None:
+            self._current_token = token
+            logger.info(f"Switched to token: {self.current_token.masked}")
             return
-            
-        # Try to find a token with remaining requests
-        attempts = 0
-        while attempts < len(self.tokens):
-            self._current_token = next(self._token_cycle)
-            if self._current_token.is_valid and self._current_token.remaining >= self.MIN_REMAINING_THRESHOLD:
-                logger.info(f"Switched to token: {self.current_token.masked}")
-                return
-            attempts += 1
         
         # All tokens exhausted - need to wait
         logger.warning("All tokens exhausted!")
@@ -298,88 +476,255 @@ class AuthManager:
         
         return self.current_token
     
+    async def aget_best_token(self) -> TokenInfo:
+        """
+        Async variant of get_best_token().
+        
+        Waiting for a reset awaits instead of blocking, so the event
+        loop keeps running.
+        
+        Returns:
+            The best available token.
+        """
+        if self._current_token.remaining < self.MIN_REMAINING_THRESHOLD:
+            await self._atry_rotate_or_wait()
+        
+        return self.current_token
+    
     def _try_rotate_or_wait(self) -> None:
         """
         Try to rotate to a valid token, or wait if all exhausted.
         """
-        # Find any token with remaining requests
-        for token in self.tokens:
-            if token.is_valid and token.remaining >= self.MIN_REMAINING_THRESHOLD:
-                while self._current_token != token:
-                    self._current_token = next(self._token_cycle)
-                logger.info(f"Switched to token: {self.current_token.masked}")
+        wait_time = self._rotate_or_get_wait()
+        if wait_time > 0:
+            logger.countdown(wait_time, "Waiting for rate limit reset")
+            self._refresh_after_wait()
+    
+    async def _atry_rotate_or_wait(self) -> None:
+        """
+        Async variant of _try_rotate_or_wait().
+        
+        Concurrent callers queue on a lock; whoever waits and refreshes
+        first leaves a usable token for the rest.
+        """
+        async with self._wait_lock:
+            if self._current_token.remaining >= self.MIN_REMAINING_THRESHOLD:
                 return
+            
+            wait_time = self._rotate_or_get_wait()
+            if wait_time > 0:
+                await logger.acountdown(wait_time, "Waiting for rate limit reset")
+                # Probes block on a thread pool; keep them off the loop
+                await asyncio.to_thread(self._refresh_after_wait)
+    
+    def _rotate_or_get_wait(self) -> int:
+        """
+        Switch to a usable token, or work out how long to wait for one.
+        
+        Returns:
+            0 if switched (or nothing to wait for), otherwise seconds
+            until the earliest reset plus a small margin.
+            
+        Raises:
+            ValueError: If no valid tokens remain.
+        """
+        # Switch to the token with the most requests left, if any
+        token = self._pick_token()
+        if token is not None:
+            self._current_token = token
+            logger.info(f"Switched to token: {self.current_token.masked}")
+            return 0
         
-        # All tokens exhausted - find minimum reset time
-        valid_tokens = [t for t in self.tokens if t.is_valid]
-        if not valid_tokens:
+        # All tokens exhausted - find the earliest reset in one pass,
+        # noting along the way whether any token is still valid
+        earliest: Optional[int] = None
+        for t in self.tokens:
+            if t.is_valid and (earliest is None or t.reset_time < earliest):
+                earliest = t.reset_time
+        if earliest is None:
             raise ValueError("No valid tokens remaining!")
         
-        min_reset = min(t.seconds_until_reset for t in valid_tokens)
+        min_reset = max(0, earliest - int(time.time()))
         
         if min_reset > 0:
             logger.warning(f"All tokens exhausted. Waiting {min_reset}s for reset...")
-            logger.countdown(min_reset + 5, "Waiting for rate limit reset")
-            
-            # Refresh rate limits after waiting
-            for token in self.tokens:
-                token.remaining = 30  # Reset to default
+            return min_reset + 5
+        return 0
     
-    def handle_rate_limit_error(self, response: requests.Response) -> bool:
+    def _refresh_after_wait(self) -> None:
+        """Re-read token counters after a reset wait and pick the best."""
+        # Re-read the real counters: tokens of one user share a quota
+        # that other clients may have spent while we waited
+        waited_at = time.monotonic()
+        self.refresh_all()
+        for token in self.tokens:
+            if token.is_valid and token.checked_at < waited_at:
+                # Probe failed; assume a fresh window that ends soon,
+                # so a wrong guess costs one short wait, not a long one
+                token.remaining = self.SEARCH_LIMIT_PER_MINUTE
+                token.reset_time = int(time.time()) + 60
+        self._heap_dirty = True
+        
+        token = self._pick_token()
+        if token is not None:
+            self._current_token = token
+    
+    def handle_rate_limit_error(
+        self,
+        response: httpx.Response,
+        token: Optional[TokenInfo] = None,
+    ) -> bool:
         """
         Handle a rate limit error response (403 or 429).
         
         GitHub's recommended handling:
         1. If Retry-After header present, wait EXACTLY that time
-        2. If no Retry-After, wait at least 60 seconds
-        3. Use exponential backoff on repeated failures
+        2. If no Retry-After, back off with decorrelated jitter: each
+           wait is drawn from [base, 3 * previous wait], capped at
+           ABUSE_BACKOFF_CAP, so repeated hits grow the wait and
+           concurrent workers don't retry in lockstep
         
         WARNING: Ignoring Retry-After can escalate to longer bans!
         
         Args:
             response: Response with rate limit error.
+            token: Token the request was sent with (defaults to the
+                current token).
+            
+        Returns:
+            True if handled and can retry, False otherwise.
+        """
+        cooldown = self.record_rate_limit_error(response, token)
+        if cooldown is None:
+            self._try_rotate_or_wait()
+        else:
+            logger.countdown(*cooldown)
+        return True
+    
+    async def ahandle_rate_limit_error(
+        self,
+        response: httpx.Response,
+        token: Optional[TokenInfo] = None,
+    ) -> bool:
+        """
+        Async variant of handle_rate_limit_error().
+        
+        Args:
+            response: Response with rate limit error.
+            token: Token the request was sent with (defaults to the
+                current token).
             
         Returns:
             True if handled and can retry, False otherwise.
         """
-        self.update_from_response(response)
+        cooldown = self.record_rate_limit_error(response, token)
+        if cooldown is None:
+            await self._atry_rotate_or_wait()
+        else:
+            await logger.acountdown(*cooldown)
+        return True
+    
+    def record_rate_limit_error(
+        self,
+        response: httpx.Response,
+        token: Optional[TokenInfo] = None,
+    ) -> Optional[Tuple[int, str]]:
+        """
+        Record a rate limit error and work out the cooldown, without waiting.
+        
+        Secondary limits rotate to another token right away; the caller
+        waits out the returned cooldown (e.g. through RateLimiter.defer()).
+        
+        Args:
+            response: Response with rate limit error.
+            token: Token the request was sent with (defaults to the
+                current token).
+            
+        Returns:
+            (seconds, countdown message), or None for primary exhaustion,
+            where the next get_best_token() rotates or waits for a reset.
+        """
+        backoff = self._plan_backoff(response, token or self.current_token)
+        if backoff is None:
+            return None
+        
+        wait_time, message, rotate = backoff
+        if rotate:
+            self._rotate_token()
+        return wait_time, message
+    
+    def _plan_backoff(
+        self, response: httpx.Response, token: TokenInfo
+    ) -> Optional[Tuple[int, str, bool]]:
+        """
+        Record a rate limit error and decide how to back off.
+        
+        Args:
+            response: Response with rate limit error.
+            token: Token the request was sent with.
+            
+        Returns:
+            (seconds, countdown message, rotate afterwards) for
+            Retry-After and secondary limits, or None for primary
+            exhaustion, where the token is marked spent and rotation
+            decides the wait.
+        """
+        self.update_from_response(response, token)
         
         # Check for Retry-After header (MUST respect this!)
         retry_after = response.headers.get("Retry-After")
         if retry_after:
             wait_time = int(retry_after)
             logger.warning(f"Rate limited. Retry-After: {wait_time}s (respecting header)")
-            logger.countdown(wait_time, "Waiting for Retry-After")
-            return True
+            return wait_time, "Waiting for Retry-After", False
         
-        # Check for abuse detection (secondary limits)
-        response_text = response.text.lower()
-        if "abuse" in response_text or "secondary" in response_text:
+        # Check for abuse detection (secondary limits). Requests left on
+        # a refused token can only mean a secondary limit; otherwise
+        # look at the error message, never the whole body
+        remaining = _header_int(response.headers.get("X-RateLimit-Remaining"))
+        message = "" if remaining else api_error_message(response)
+        if remaining or "abuse" in message or "secondary" in message:
             logger.warning(
                 "Secondary rate limit (abuse detection) triggered!\n"
                 "This happens when:\n"
                 "  - Too many concurrent requests\n"
                 "  - Requests too fast to same endpoint\n"
                 "  - Rapid-fire bursting\n"
-                "Sleeping 60s and switching token..."
+                "Backing off and switching token..."
             )
-            time.sleep(60)
-            self._rotate_token()
-            return True
+            key = token.token
+            previous = self._backoff.get(key, self.ABUSE_BACKOFF_BASE)
+            delay = random.uniform(
+                self.ABUSE_BACKOFF_BASE,
+                min(self.ABUSE_BACKOFF_CAP, previous * 3),
+            )
+            self._backoff[key] = delay
+            logger.warning(f"Sleeping {delay:.1f}s...")
+            return math.ceil(delay), "Backing off from secondary rate limit", True
         
         # Regular rate limit exhaustion
-        self._current_token.remaining = 0
+        token.remaining = 0
+        self._heap_dirty = True
         logger.warning(
-            f"Primary rate limit exhausted for token {self.current_token.masked}"
+            f"Primary rate limit exhausted for token {token.masked}"
         )
-        self._try_rotate_or_wait()
-        return True
+        return None
+    
+    def close(self) -> None:
+        """Close the rate limit probe session."""
+        self._session.close()
     
     def display_status(self) -> None:
         """Display current token status."""
+        token = self.current_token
+        # Tokens share a handful of reset times, so format each only once
+        if token.reset_time:
+            reset_str = _fmt_hms(token.reset_time)
+        else:
+            reset_str = token.reset_datetime.strftime("%H:%M:%S")
         logger.token_status(
-            token_id=self.current_token.masked,
-            remaining=self.current_token.remaining,
-            reset_time=self.current_token.reset_datetime.strftime("%H:%M:%S"),
+            token_id=token.masked,
+            remaining=token.remaining,
+            reset_time=reset_str,
         )
 
@@ -4,129 +4,34 @@ Supports live-saving to prevent data loss on crashes.
 """
 
 import csv
-import json
+import io
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from string import Template
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..utils import logger
-from ..utils.helpers import SearchResult
+from ..utils.helpers import SearchResult, json_dumps_pretty
 
+# CSV header row, terminated like csv.writer's rows
+CSV_HEADER = (
+    "type,name,url,html_url,owner,"
+    "created_at,updated_at,description,language,stars\r\n"
+)
 
-class OutputManager:
-    """
-    Manages output in multiple formats with live-saving capability.
-    
-    Supports: TXT, JSON, CSV, HTML, and ALL formats.
-    Implements append-mode saving to prevent data loss on crashes.
-    
-    Attributes:
-        output_path: Base path for output file.
-        format: Output format(s).
-        results: Accumulated results.
-    """
-    
-    FORMATS = {"txt", "json", "csv", "html", "all"}
-    
-    def __init__(
-        self,
-        output_path: str,
-        output_format: str = "json",
-        domain: str = "",
-    ):
-        """
-        Initialize the output manager.
-        
-        Args:
-            output_path: Base path for output file.
-            output_format: Output format (txt/json/csv/html/all).
-            domain: Target domain for naming.
-        """
-        self.base_path = Path(output_path)
-        self.format = output_format.lower()
-        self.domain = domain
-        self.results: List[SearchResult] = []
-        self._files_created: Dict[str, Path] = {}
-        self._json_buffer: List[Dict] = []
-        
-        if self.format not in self.FORMATS:
-            logger.warning(f"Unknown format '{self.format}', using 'json'")
-            self.format = "json"
-        
-        # Initialize output files
-        self._initialize_files()
-    
-    def _get_file_path(self, ext: str) -> Path:
-        """
-        Get the output file path for a given extension.
-        
-        Args:
-            ext: File extension.
-            
-        Returns:
-            Path object for the output file.
-        """
-        base = self.base_path
-        if base.suffix:
-            # Remove existing extension
-            base = base.with_suffix("")
-        return base.with_suffix(f".{ext}")
-    
-    def _initialize_files(self) -> None:
-        """Initialize output files based on format."""
-        formats_to_init = []
-        
-        if self.format == "all":
-            formats_to_init = ["txt", "json", "csv", "html"]
-        else:
-            formats_to_init = [self.format]
-        
-        for fmt in formats_to_init:
-            path = self._get_file_path(fmt)
-            self._files_created[fmt] = path
-            
-            # Initialize files with headers
-            if fmt == "csv":
-                self._init_csv(path)
-            elif fmt == "html":
-                self._init_html(path)
-            elif fmt == "json":
-                self._init_json(path)
-            elif fmt == "txt":
-                self._init_txt(path)
-    
-    def _init_txt(self, path: Path) -> None:
-        """Initialize TXT file."""
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(f"# TrufflePiggie Results\n")
-            f.write(f"# Domain: {self.domain}\n")
-            f.write(f"# Generated: {datetime.now().isoformat()}\n")
-            f.write("#" + "=" * 60 + "\n\n")
-    
-    def _init_json(self, path: Path) -> None:
-        """Initialize JSON file."""
-        # JSON will be written at finalization
-        pass
-    
-    def _init_csv(self, path: Path) -> None:
-        """Initialize CSV file with headers."""
-        with open(path, "w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "type", "name", "url", "html_url", "owner",
-                "created_at", "updated_at", "description", "language", "stars"
-            ])
-    
-    def _init_html(self, path: Path) -> None:
-        """Initialize HTML file with header."""
-        html_header = f"""<!DOCTYPE html>
+# Width of the stat counters in the HTML header. They are written as
+# "0" padded with spaces and overwritten in place at finalize.
+STAT_SLOT_WIDTH = 10
+
+HTML_HEADER_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TrufflePiggie Results - {self.domain}</title>
+    <title>TrufflePiggie Results - $domain</title>
     <style>
-        :root {{
+        :root {
             --bg: #0d1117;
             --surface: #161b22;
             --border: #30363d;
@@ -138,186 +43,389 @@ class OutputManager:
             --warning: #d29922;
             --repo-bg: #1f2937;
             --gist-bg: #2d1f3d;
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, sans-serif;
             background: var(--bg);
             color: var(--text);
             line-height: 1.6;
             padding: 2rem;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
-        }}
+        }
         
-        header {{
+        header {
             text-align: center;
             padding: 2rem 0;
             border-bottom: 1px solid var(--border);
             margin-bottom: 2rem;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2.5rem;
             background: linear-gradient(135deg, #58a6ff, #a371f7);
             -webkit-background-clip: text;
             -webkit-text-fill-color: transparent;
             background-clip: text;
-        }}
+        }
         
-        .meta {{
+        .meta {
             color: var(--text-dim);
             margin-top: 0.5rem;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: flex;
             gap: 2rem;
             justify-content: center;
             margin: 1.5rem 0;
-        }}
+        }
         
-        .stat {{
+        .stat {
             background: var(--surface);
             padding: 1rem 2rem;
             border-radius: 8px;
             border: 1px solid var(--border);
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 2rem;
             font-weight: bold;
             color: var(--accent);
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             color: var(--text-dim);
             font-size: 0.875rem;
-        }}
+        }
         
-        .results {{
+        .results {
             display: grid;
             gap: 1rem;
-        }}
+        }
         
-        .result {{
+        .result {
             background: var(--surface);
             border: 1px solid var(--border);
             border-radius: 8px;
             padding: 1.25rem;
             transition: border-color 0.2s, transform 0.2s;
-        }}
+        }
         
-        .result:hover {{
+        .result:hover {
             border-color: var(--accent);
             transform: translateY(-2px);
-        }}
+        }
         
-        .result.repo {{
+        .result.repo {
             border-left: 3px solid var(--success);
-        }}
+        }
         
-        .result.gist {{
+        .result.gist {
             border-left: 3px solid var(--warning);
-        }}
+        }
         
-        .result-header {{
+        .result-header {
             display: flex;
             align-items: center;
             gap: 1rem;
             margin-bottom: 0.75rem;
-        }}
+        }
         
-        .result-type {{
+        .result-type {
             padding: 0.25rem 0.75rem;
             border-radius: 20px;
             font-size: 0.75rem;
             font-weight: 600;
             text-transform: uppercase;
-        }}
+        }
         
-        .result-type.repo {{
+        .result-type.repo {
             background: rgba(63, 185, 80, 0.2);
             color: var(--success);
-        }}
+        }
         
-        .result-type.gist {{
+        .result-type.gist {
             background: rgba(210, 153, 34, 0.2);
             color: var(--warning);
-        }}
+        }
         
-        .result-name {{
+        .result-name {
             font-size: 1.125rem;
             font-weight: 600;
-        }}
+        }
         
-        .result-name a {{
+        .result-name a {
             color: var(--accent);
             text-decoration: none;
-        }}
+        }
         
-        .result-name a:hover {{
+        .result-name a:hover {
             color: var(--accent-hover);
             text-decoration: underline;
-        }}
+        }
         
-        .result-meta {{
+        .result-meta {
             display: flex;
             gap: 1.5rem;
             color: var(--text-dim);
             font-size: 0.875rem;
             flex-wrap: wrap;
-        }}
+        }
         
-        .result-desc {{
+        .result-desc {
             margin-top: 0.75rem;
             color: var(--text-dim);
-        }}
+        }
         
-        footer {{
+        footer {
             text-align: center;
             padding: 2rem;
             color: var(--text-dim);
             border-top: 1px solid var(--border);
             margin-top: 2rem;
-        }}
+        }
         
-        footer a {{
+        footer a {
             color: var(--accent);
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <header>
             <h1>🐷 TrufflePiggie Results</h1>
-            <p class="meta">Target: <strong>{self.domain}</strong> | Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p class="meta">Target: <strong>$domain</strong> | Generated: $generated</p>
         </header>
         
         <div class="stats" id="stats">
             <div class="stat">
-                <div class="stat-value" id="repo-count">0</div>
+                <div class="stat-value" id="repo-count">$repo_slot</div>
                 <div class="stat-label">Repositories</div>
             </div>
             <div class="stat">
-                <div class="stat-value" id="gist-count">0</div>
+                <div class="stat-value" id="gist-count">$gist_slot</div>
                 <div class="stat-label">Gists</div>
             </div>
         </div>
         
         <div class="results" id="results">
+""")
+
+HTML_ITEM_TEMPLATE = Template("""
+            <div class="result $type_class">
+                <div class="result-header">
+                    <span class="result-type $type_class">$type</span>
+                    <span class="result-name">
+                        <a href="$html_url" target="_blank">$name</a>
+                    </span>
+                </div>
+                <div class="result-meta">
+                    <span>👤 $owner</span>
+                    $stars
+                    $language
+                    $created
+                </div>
+                $desc
+            </div>
+""")
+
+HTML_FOOTER = """
+        </div>
+        
+        <footer>
+            <p>Generated by <strong>TrufflePiggie</strong> | 
+            <a href="https://github.com/trufflesecurity/trufflehog" target="_blank">TruffleHog</a></p>
+        </footer>
+    </div>
+</body>
+</html>
 """
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(html_header)
+
+
+class OutputManager:
+    """
+    Manages output in multiple formats with live-saving capability.
+    
+    Supports: TXT, JSON, CSV, HTML, and ALL formats.
+    Implements append-mode saving to prevent data loss on crashes.
+    Live-saved files stay open as raw descriptors until finalize() or
+    close(); each batch of results is a single unbuffered write per file.
+    
+    Attributes:
+        output_path: Base path for output file.
+        format: Output format(s).
+        result_count: Number of results written.
+    """
+    
+    FORMATS = {"txt", "json", "csv", "html", "all"}
+    
+    def __init__(
+        self,
+        output_path: str,
+        output_format: str = "json",
+        domain: str = "",
+    ):
+        """
+        Initialize the output manager.
+        
+        Args:
+            output_path: Base path for output file.
+            output_format: Output format (txt/json/csv/html/all).
+            domain: Target domain for naming.
+        """
+        self.base_path = Path(output_path)
+        self.format = output_format.lower()
+        self.domain = domain
+        self.result_count = 0
+        # Results live in the output files; only TruffleHog URLs stay here
+        self._targets: List[str] = []
+        
+        # One timestamp for every file this manager writes
+        started_at = datetime.now()
+        self._iso = started_at.isoformat()
+        self._pretty = started_at.strftime("%Y-%m-%d %H:%M:%S")
+        
+        self._files_created: Dict[str, Path] = {}
+        self._fds: Dict[str, int] = {}
+        # CSV rows are formatted into a reusable buffer, then written raw
+        self._csv_buffer = io.StringIO()
+        self._csv_writer: Optional[Any] = None
+        # Byte offsets of the HTML stat slots: (repo count, gist count)
+        self._html_offsets: Optional[Tuple[int, int]] = None
+        self._json_empty = True  # No result written to the JSON file yet
+        
+        if self.format not in self.FORMATS:
+            logger.warning(f"Unknown format '{self.format}', using 'json'")
+            self.format = "json"
+        
+        # Initialize output files
+        self._initialize_files()
+    
+    def _get_file_path(self, ext: str) -> Path:
+        """
+        Get the output file path for a given extension.
+        
+        Args:
+            ext: File extension.
+            
+        Returns:
+            Path object for the output file.
+        """
+        base = self.base_path
+        if base.suffix:
+            # Remove existing extension
+            base = base.with_suffix("")
+        return base.with_suffix(f".{ext}")
+    
+    def _initialize_files(self) -> None:
+        """Initialize output files based on format."""
+        formats_to_init = []
+        
+        if self.format == "all":
+            formats_to_init = ["txt", "json", "csv", "html"]
+        else:
+            formats_to_init = [self.format]
+        
+        for fmt in formats_to_init:
+            path = self._get_file_path(fmt)
+            self._files_created[fmt] = path
+            
+            # Initialize files with headers
+            if fmt == "csv":
+                self._init_csv(path)
+            elif fmt == "html":
+                self._init_html(path)
+            elif fmt == "json":
+                self._init_json(path)
+            elif fmt == "txt":
+                self._init_txt(path)
+    
+    def _open(self, fmt: str, path: Path) -> None:
+        """
+        Create an output file and keep its descriptor open for live-saving.
+        
+        Args:
+            fmt: Format the file is written for.
+            path: File path.
+        """
+        flags = (
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND
+            | getattr(os, "O_BINARY", 0)  # No newline translation on Windows
+        )
+        self._fds[fmt] = os.open(path, flags, 0o644)
+    
+    def _write(self, fmt: str, text: str) -> None:
+        """
+        Write text to an output file in a single unbuffered write.
+        
+        Args:
+            fmt: Format of the file to write to.
+            text: Text to append.
+        """
+        fd = self._fds.get(fmt)
+        if fd is None or not text:
+            return
+        
+        data = memoryview(text.encode("utf-8"))
+        while data:
+            # Regular files take it all at once; loop in case they don't
+            data = data[os.write(fd, data):]
+    
+    def _init_txt(self, path: Path) -> None:
+        """Initialize TXT file."""
+        self._open("txt", path)
+        self._write(
+            "txt",
+            f"# TrufflePiggie Results\n"
+            f"# Domain: {self.domain}\n"
+            f"# Generated: {self._iso}\n"
+            + "#" + "=" * 60 + "\n\n",
+        )
+    
+    def _init_json(self, path: Path) -> None:
+        """Initialize JSON file; results are streamed, meta follows them."""
+        self._open("json", path)
+        self._write("json", '{\n  "results": [')
+    
+    def _init_csv(self, path: Path) -> None:
+        """Initialize CSV file with headers."""
+        self._open("csv", path)
+        self._csv_writer = csv.writer(self._csv_buffer)
+        self._write("csv", CSV_HEADER)
+    
+    def _take_csv_buffer(self) -> str:
+        """Get the rows formatted so far and empty the CSV buffer."""
+        text = self._csv_buffer.getvalue()
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        return text
+    
+    def _init_html(self, path: Path) -> None:
+        """Initialize HTML file with header."""
+        header = HTML_HEADER_TEMPLATE.substitute(
+            domain=self.domain,
+            generated=self._pretty,
+            repo_slot="0".ljust(STAT_SLOT_WIDTH),
+            gist_slot="0".ljust(STAT_SLOT_WIDTH),
+        )
+        data = header.encode("utf-8")
+        self._html_offsets = (
+            data.index(b'id="repo-count">') + len(b'id="repo-count">'),
+            data.index(b'id="gist-count">') + len(b'id="gist-count">'),
+        )
+        self._open("html", path)
+        self._write("html", header)
     
     def add_result(self, result: SearchResult) -> None:
         """
@@ -326,84 +434,97 @@ class OutputManager:
         Args:
             result: Search result to add.
         """
-        self.results.append(result)
-        self._json_buffer.append(result.to_dict())
+        self.add_results([result])
+    
+    def add_results(self, results: List[SearchResult]) -> None:
+        """
+        Add a batch of results with one write per output file.
+        
+        Args:
+            results: Search results to add.
+        """
+        if not results:
+            return
+        
+        self.result_count += len(results)
+        self._targets.extend(r.to_trufflehog_target() for r in results)
         
         # Live-save to each format
         if self.format == "all":
-            self._append_txt(result)
-            self._append_csv(result)
-            self._append_html(result)
+            self._append_txt(results)
+            self._append_json(results)
+            self._append_csv(results)
+            self._append_html(results)
+        elif self.format == "json":
+            self._append_json(results)
         elif self.format == "txt":
-            self._append_txt(result)
+            self._append_txt(results)
         elif self.format == "csv":
-            self._append_csv(result)
+            self._append_csv(results)
         elif self.format == "html":
-            self._append_html(result)
+            self._append_html(results)
     
-    def _append_txt(self, result: SearchResult) -> None:
-        """Append result to TXT file."""
-        path = self._files_created.get("txt")
-        if not path:
-            return
-            
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(f"[{result.type.upper()}] {result.name}\n")
-            f.write(f"  URL: {result.html_url}\n")
-            f.write(f"  Owner: {result.owner}\n")
-            if result.description:
-                f.write(f"  Description: {result.description[:100]}\n")
-            f.write("\n")
+    def _append_txt(self, results: List[SearchResult]) -> None:
+        """Append results to TXT file."""
+        if "txt" in self._fds:
+            self._write("txt", "".join(self._format_txt(r) for r in results))
     
-    def _append_csv(self, result: SearchResult) -> None:
-        """Append result to CSV file."""
-        path = self._files_created.get("csv")
-        if not path:
-            return
-            
-        with open(path, "a", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                result.type,
-                result.name,
-                result.url,
-                result.html_url,
-                result.owner,
-                result.created_at or "",
-                result.updated_at or "",
-                (result.description or "")[:200],
-                result.language or "",
-                result.stars,
-            ])
+    def _format_txt(self, result: SearchResult) -> str:
+        """Format a result as a TXT entry."""
+        entry = (
+            f"[{result.type.upper()}] {result.name}\n"
+            f"  URL: {result.html_url}\n"
+            f"  Owner: {result.owner}\n"
+        )
+        if result.description:
+            entry += f"  Description: {result.description[:100]}\n"
+        return entry + "\n"
     
-    def _append_html(self, result: SearchResult) -> None:
-        """Append result to HTML file."""
-        path = self._files_created.get("html")
-        if not path:
+    def _append_json(self, results: List[SearchResult]) -> None:
+        """Append results to the JSON file's results array."""
+        if "json" not in self._fds:
             return
         
-        type_class = "repo" if result.type == "repository" else "gist"
-        desc = result.description[:150] + "..." if result.description and len(result.description) > 150 else (result.description or "")
+        parts = []
+        for result in results:
+            # Separators lead each entry, so nothing needs undoing at the end
+            parts.append("\n    " if self._json_empty else ",\n    ")
+            self._json_empty = False
+            entry = json_dumps_pretty(result.to_dict())
+            parts.append(entry.replace("\n", "\n    "))
+        self._write("json", "".join(parts))
+    
+    def _append_csv(self, results: List[SearchResult]) -> None:
+        """Append results to CSV file."""
+        if self._csv_writer is None:
+            return
         
-        html_item = f"""
-            <div class="result {type_class}">
-                <div class="result-header">
-                    <span class="result-type {type_class}">{result.type}</span>
-                    <span class="result-name">
-                        <a href="{result.html_url}" target="_blank">{result.name}</a>
-                    </span>
-                </div>
-                <div class="result-meta">
-                    <span>👤 {result.owner}</span>
-                    {f'<span>⭐ {result.stars}</span>' if result.stars else ''}
-                    {f'<span>💻 {result.language}</span>' if result.language else ''}
-                    {f'<span>📅 {result.created_at[:10] if result.created_at else ""}</span>' if result.created_at else ''}
-                </div>
-                {f'<p class="result-desc">{desc}</p>' if desc else ''}
-            </div>
-"""
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(html_item)
+        self._csv_writer.writerows(result.to_row() for result in results)
+        self._write("csv", self._take_csv_buffer())
+    
+    def _append_html(self, results: List[SearchResult]) -> None:
+        """Append results to HTML file."""
+        if "html" in self._fds:
+            self._write("html", "".join(self._format_html(r) for r in results))
+    
+    def _format_html(self, result: SearchResult) -> str:
+        """Format a result as an HTML card."""
+        desc = result.description or ""
+        if len(desc) > 150:
+            desc = desc[:150] + "..."
+        
+        # Optional parts become empty strings; their lines stay in place
+        return HTML_ITEM_TEMPLATE.substitute(
+            type_class="repo" if result.type == "repository" else "gist",
+            type=result.type,
+            html_url=result.html_url,
+            name=result.name,
+            owner=result.owner,
+            stars=f"<span>⭐ {result.stars}</span>" if result.stars else "",
+            language=f"<span>💻 {result.language}</span>" if result.language else "",
+            created=f"<span>📅 {result.created_at[:10]}</span>" if result.created_at else "",
+            desc=f'<p class="result-desc">{desc}</p>' if desc else "",
+        )
     
     def finalize(self, total_repos: int = 0, total_gists: int = 0) -> List[Path]:
         """
@@ -424,60 +545,66 @@ class OutputManager:
         if "html" in self._files_created:
             self._finalize_html(total_repos, total_gists)
         
+        # Make the finished files durable once, not on every append
+        for fd in self._fds.values():
+            os.fsync(fd)
+        
+        self.close()
         return list(self._files_created.values())
     
+    def close(self) -> None:
+        """Close all live-saved output files."""
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+        self._csv_writer = None
+    
+    def __enter__(self) -> "OutputManager":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+    
     def _finalize_json(self) -> None:
-        """Write final JSON file."""
-        path = self._files_created.get("json")
-        if not path:
+        """Close the JSON results array and append the meta block."""
+        if "json" not in self._fds:
             return
-            
-        output = {
-            "meta": {
-                "tool": "TrufflePiggie",
-                "domain": self.domain,
-                "generated": datetime.now().isoformat(),
-                "total_results": len(self._json_buffer),
-            },
-            "results": self._json_buffer,
-        }
         
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        meta = {
+            "tool": "TrufflePiggie",
+            "domain": self.domain,
+            "generated": self._iso,
+            "total_results": self.result_count,
+        }
+        meta_json = json_dumps_pretty(meta)
+        self._write(
+            "json",
+            ("]" if self._json_empty else "\n  ]")
+            + ',\n  "meta": ' + meta_json.replace("\n", "\n  ") + "\n}\n",
+        )
     
     def _finalize_html(self, total_repos: int, total_gists: int) -> None:
-        """Close HTML file with footer."""
-        path = self._files_created.get("html")
-        if not path:
+        """Close HTML file with footer and fill in the header stats."""
+        if "html" not in self._fds:
             return
-            
-        html_footer = f"""
-        </div>
         
-        <footer>
-            <p>Generated by <strong>TrufflePiggie</strong> | 
-            <a href="https://github.com/trufflesecurity/trufflehog" target="_blank">TruffleHog</a></p>
-        </footer>
-    </div>
-    
-    <script>
-        document.getElementById('repo-count').textContent = '{total_repos}';
-        document.getElementById('gist-count').textContent = '{total_gists}';
-    </script>
-</body>
-</html>
-"""
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(html_footer)
+        self._write("html", HTML_FOOTER)
+        
+        # Overwrite the reserved counter slots in place; nothing else moves.
+        # The live-save descriptor appends only, so seek on a second one
+        with open(self._files_created["html"], "r+b") as raw:
+            for offset, value in zip(self._html_offsets, (total_repos, total_gists)):
+                raw.seek(offset)
+                raw.write(str(value).ljust(STAT_SLOT_WIDTH).encode())
     
-    def get_trufflehog_targets(self) -> List[str]:
+    def get_trufflehog_targets(self) -> Iterator[str]:
         """
-        Get list of URLs for TruffleHog scanning.
+        Iterate over the URLs for TruffleHog scanning.
         
         Returns:
-            List of repository/gist URLs.
+            Iterator of repository/gist URLs.
         """
-        return [r.to_trufflehog_target() for r in self.results]
+        return iter(self._targets)
     
     def export_trufflehog_list(self, output_path: Optional[str] = None) -> Path:
         """
@@ -495,8 +622,7 @@ class OutputManager:
             output_path = Path(output_path)
         
         with open(output_path, "w", encoding="utf-8") as f:
-            for url in self.get_trufflehog_targets():
-                f.write(f"{url}\n")
+            f.writelines(f"{url}\n" for url in self.get_trufflehog_targets())
         
         logger.success(f"TruffleHog target list saved to: {output_path}")
         return output_path
@@ -2,22 +2,48 @@
 Helper utilities and common functions.
 """
 
+import hashlib
+import json
 import re
 import signal
+import socket
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
-import yaml
+try:
+    import yaml
+except ImportError:  # Reported by load_config() when a config file exists
+    yaml = None
+    _YamlLoader = None
+    _YamlError: Any = ()  # Catches nothing
+else:
+    # libyaml's C loader when PyYAML was built with it
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YamlError = yaml.YAMLError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is the fallback
+    orjson = None
 
-@dataclass
+# URL scheme stripped from domains given as URLs
+_PROTOCOL_RE = re.compile(r'^https?://')
+
+# Days per month in a common year; February gains a day in leap years
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """
     Represents a single search result from GitHub.
     
+    Immutable once parsed; raw_data is excluded from hashing.
+    
     Attributes:
         type: Result type (repo/gist).
         name: Repository or Gist name.
@@ -41,7 +67,7 @@ class SearchResult:
     description: Optional[str] = None
     language: Optional[str] = None
     stars: int = 0
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    raw_data: Dict[str, Any] = field(default_factory=dict, hash=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -58,6 +84,27 @@ class SearchResult:
             "stars": self.stars,
         }
     
+    def to_row(self) -> Tuple[Any, ...]:
+        """
+        Convert to a CSV row, in the column order of the CSV header.
+        
+        Returns:
+            Row tuple; missing values are empty strings and the
+            description is trimmed to 200 characters.
+        """
+        return (
+            self.type,
+            self.name,
+            self.url,
+            self.html_url,
+            self.owner,
+            self.created_at or "",
+            self.updated_at or "",
+            (self.description or "")[:200],
+            self.language or "",
+            self.stars,
+        )
+    
     def to_trufflehog_target(self) -> str:
         """Get the URL/target for TruffleHog scanning."""
         return self.html_url
@@ -69,13 +116,13 @@ class ScanState:
     Maintains the current scan state for graceful shutdown.
     
     Attributes:
-        results: Set of unique result URLs (for deduplication).
+        results: 64-bit fingerprints of result URLs (for deduplication).
         total_repos: Count of repositories found.
         total_gists: Count of gists found.
         current_slice: Current time slice being processed.
         start_time: Scan start timestamp.
     """
-    results: Set[str] = field(default_factory=set)
+    results: Set[int] = field(default_factory=set)
     total_repos: int = 0
     total_gists: int = 0
     current_slice: str = ""
@@ -86,16 +133,27 @@ class ScanState:
         """
         Add a result if not duplicate.
         
+        Safe under concurrent asyncio tasks: the check-and-insert never
+        awaits, so no other task can interleave.
+        
         Args:
             result: Search result to add.
             
         Returns:
             True if added (new), False if duplicate.
         """
-        if result.url in self.results:
+        # Keep an 8-byte fingerprint, not the URL string itself
+        key = int.from_bytes(
+            hashlib.blake2b(result.url.encode(), digest_size=8).digest(),
+            "little",
+        )
+        
+        # One hash lookup: a set that didn't grow already had the URL
+        seen = len(self.results)
+        self.results.add(key)
+        if len(self.results) == seen:
             return False
         
-        self.results.add(result.url)
         if result.type == "repository":
             self.total_repos += 1
         else:
@@ -107,10 +165,68 @@ class ScanState:
         return (datetime.now() - self.start_time).total_seconds()
 
 
+def json_loads(data: bytes) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Args:
+        data: Raw JSON bytes (e.g. a response body).
+        
+    Returns:
+        Decoded Python object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """
+    Encode an object as 2-space indented JSON, using orjson when installed.
+    
+    Both encoders produce the same layout and write non-ASCII text as is.
+    
+    Args:
+        obj: Object to encode.
+        
+    Returns:
+        JSON text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def api_error_message(response: Any) -> str:
+    """
+    Get the lowercased "message" field of a GitHub API error body.
+    
+    Only the short message is lowercased, not the whole body.
+    
+    Args:
+        response: Error response.
+        
+    Returns:
+        Lowercased error message, or "" if the body has none.
+    """
+    try:
+        body = json_loads(response.content)
+    except ValueError:
+        return ""
+    if not isinstance(body, dict):
+        return ""
+    message = body.get("message")
+    return message.lower() if isinstance(message, str) else ""
+
+
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
     
+    Parsed configs are cached by path and modification time, so the
+    file is only re-read when it changes. The returned dict is shared
+    between callers and must not be mutated.
+    
     Args:
         config_path: Path to config file.
         
@@ -119,7 +235,28 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """
     if config_path is None:
         config_path = Path(__file__).parent.parent.parent / "config" / "settings.yaml"
+    config_path = Path(config_path)
+    
+    try:
+        mtime = config_path.stat().st_mtime
+    except OSError:
+        mtime = None
     
+    return _load_config_cached(config_path, mtime)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: Path, mtime: Optional[float]) -> Dict[str, Any]:
+    """
+    Parse a config file and merge in defaults.
+    
+    Args:
+        config_path: Path to config file.
+        mtime: Modification time, part of the cache key only.
+        
+    Returns:
+        Configuration dictionary.
+    """
     default_config = {
         "app": {"name": "TrufflePiggie", "version": "1.0.0"},
         "network": {
@@ -128,10 +265,13 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
             "max_retries": 3,
             "timeout": 15,
             "abuse_sleep": 60,
+            "concurrency": 3,
         },
         "search": {
             "per_page": 100,
             "max_depth": "day",
+            "max_concurrency": 5,
+            "domains_per_query": 5,
             "default_years": "2015-2024",
         },
         "github": {
@@ -145,25 +285,33 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
         },
     }
     
+    if yaml is None:
+        if mtime is not None:
+            raise ImportError(
+                f"PyYAML is required to read {config_path} (pip install pyyaml)"
+            )
+        # No readable config file; nothing to parse
+        return default_config
+    
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-            # Merge with defaults
-            for key, value in default_config.items():
-                if key not in config:
-                    config[key] = value
-                elif isinstance(value, dict):
-                    for subkey, subvalue in value.items():
-                        if subkey not in config[key]:
-                            config[key][subkey] = subvalue
-            return config
+            config = yaml.load(f, Loader=_YamlLoader) or {}
+        # Merge with defaults, one dict merge per section
+        for key, value in default_config.items():
+            user_value = config.get(key)
+            if user_value is None:
+                config[key] = value
+            elif isinstance(value, dict) and isinstance(user_value, dict):
+                config[key] = {**value, **user_value}
+        return config
     except FileNotFoundError:
         return default_config
-    except yaml.YAMLError as e:
+    except _YamlError as e:
         print(f"Error parsing config: {e}")
         return default_config
 
 
+@lru_cache(maxsize=32)
 def parse_year_range(year_str: str) -> tuple[int, int]:
     """
     Parse year range string.
@@ -195,12 +343,8 @@ def validate_domain(domain: str) -> str:
     Raises:
         ValueError: If domain is invalid.
     """
-    # Remove protocol if present
-    domain = re.sub(r'^https?://', '', domain)
-    # Remove trailing slashes
-    domain = domain.rstrip('/')
-    # Remove paths
-    domain = domain.split('/')[0]
+    # Remove protocol, trailing slashes and paths
+    domain = _PROTOCOL_RE.sub('', domain, count=1).rstrip('/').split('/', 1)[0]
     
     # Basic validation
     if not domain or len(domain) < 3:
@@ -209,6 +353,59 @@ def validate_domain(domain: str) -> str:
     return domain
 
 
+def quote_domains(domains: Sequence[str]) -> str:
+    """
+    Build an exact-match search term for one or more domains.
+    
+    Args:
+        domains: Domains to match.
+        
+    Returns:
+        Quoted domains joined with OR (e.g. '"a.com" OR "b.com"').
+    """
+    return " OR ".join(f'"{domain}"' for domain in domains)
+
+
+def group_domains(
+    domains: Sequence[str],
+    max_query_len: int = 200,
+    max_terms: int = 5,
+) -> List[List[str]]:
+    """
+    Greedily pack domains into groups searchable as one OR query.
+    
+    GitHub caps search queries at 256 characters and five boolean
+    operators; max_query_len leaves room for the created: qualifier.
+    
+    Args:
+        domains: Domains in scan order.
+        max_query_len: Longest allowed quote_domains() result.
+        max_terms: Most domains per group.
+        
+    Returns:
+        Groups of domains, in order. A domain too long to share a
+        query gets a group of its own.
+    """
+    groups: List[List[str]] = []
+    group: List[str] = []
+    length = 0
+    
+    for domain in domains:
+        # Quotes, plus " OR " when joining an existing group
+        added = len(domain) + 2 + (4 if group else 0)
+        if group and (len(group) >= max_terms or length + added > max_query_len):
+            groups.append(group)
+            group, length = [], 0
+            added = len(domain) + 2
+        group.append(domain)
+        length += added
+    
+    if group:
+        groups.append(group)
+    return groups
+
+
+@lru_cache(maxsize=128)
 def mask_token(token: str) -> str:
     """
     Mask a token for display, showing only first and last 4 chars.
@@ -224,21 +421,36 @@ def mask_token(token: str) -> str:
     return f"{token[:4]}...{token[-4:]}"
 
 
-def setup_signal_handlers(state: ScanState) -> None:
+def setup_signal_handlers(state: ScanState) -> socket.socket:
     """
     Setup graceful shutdown handlers for Ctrl+C.
     
+    The handler only sets the interrupted flag and writes a byte to a
+    socket pair; logging is left to whoever reads the returned socket,
+    outside the signal context.
+    
     Args:
         state: Scan state to preserve on shutdown.
+        
+    Returns:
+        Non-blocking socket that becomes readable on each interrupt.
     """
+    # A socket pair rather than os.pipe so select/asyncio work on Windows
+    wakeup_r, wakeup_w = socket.socketpair()
+    wakeup_r.setblocking(False)
+    wakeup_w.setblocking(False)
+    
     def signal_handler(signum: int, frame: Any) -> None:
-        from . import logger
-        logger.warning("\nInterrupt received! Saving current progress...")
         state.interrupted = True
+        try:
+            wakeup_w.send(b"\0")
+        except OSError:
+            pass  # Buffer full: a wakeup is already pending
     
     signal.signal(signal.SIGINT, signal_handler)
     if sys.platform != "win32":
         signal.signal(signal.SIGTERM, signal_handler)
+    return wakeup_r
 
 
 def format_date_range(start_date: str, end_date: str) -> str:
@@ -255,48 +467,50 @@ def format_date_range(start_date: str, end_date: str) -> str:
     return f"{start_date}..{end_date}"
 
 
-def get_months_in_year(year: int) -> List[tuple[str, str]]:
+@lru_cache(maxsize=256)
+def get_months_in_year(year: int) -> Tuple[Tuple[str, str], ...]:
     """
     Get all month ranges for a given year.
     
+    Cached; the result is a tuple so callers can't mutate shared state.
+    
     Args:
         year: Year to split into months.
         
     Returns:
-        List of (start_date, end_date) tuples for each month.
+        Tuple of (start_date, end_date) tuples for each month.
     """
-    months = []
-    for month in range(1, 13):
-        start = f"{year}-{month:02d}-01"
-        if month == 12:
-            end = f"{year}-12-31"
-        else:
-            # Last day of current month
-            import calendar
-            last_day = calendar.monthrange(year, month)[1]
-            end = f"{year}-{month:02d}-{last_day:02d}"
-        months.append((start, end))
-    return months
+    return tuple(
+        (f"{year}-{month:02d}-01", f"{year}-{month:02d}-{_last_day(year, month):02d}")
+        for month in range(1, 13)
+    )
 
 
-def get_days_in_month(year: int, month: int) -> List[tuple[str, str]]:
+@lru_cache(maxsize=256)
+def get_days_in_month(year: int, month: int) -> Tuple[Tuple[str, str], ...]:
     """
     Get all day ranges for a given month.
     
+    Cached; the result is a tuple so callers can't mutate shared state.
+    
     Args:
         year: Year.
         month: Month (1-12).
         
     Returns:
-        List of (start_date, end_date) tuples for each day.
+        Tuple of (start_date, end_date) tuples for each day.
     """
-    import calendar
     days = []
-    last_day = calendar.monthrange(year, month)[1]
-    
-    for day in range(1, last_day + 1):
+    for day in range(1, _last_day(year, month) + 1):
         date_str = f"{year}-{month:02d}-{day:02d}"
         days.append((date_str, date_str))
     
-    return days
+    return tuple(days)
+
+
+def _last_day(year: int, month: int) -> int:
+    """Get the number of days in a month, from the static table."""
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
 
@@ -1,31 +1,117 @@
 """
-Robust HTTP client with retry logic, jitter, and User-Agent rotation.
+Robust async HTTP client with retry logic, jitter, and User-Agent rotation.
 """
 
+import asyncio
 import random
+import socket
 import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import httpx
 
 from . import logger
 
+DEFAULT_USER_AGENTS_FILE = Path(__file__).parent.parent.parent / "user_agents.txt"
+
+
+@lru_cache(maxsize=4)
+def _load_user_agents(file_path: Path) -> Tuple[str, ...]:
+    """
+    Load User-Agents from file, once per path.
+    
+    Args:
+        file_path: Path to User-Agents file.
+        
+    Returns:
+        Tuple of User-Agent strings.
+    """
+    default_ua = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36",
+    )
+    
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            agents = tuple(agent for agent in map(str.strip, f) if agent)
+            return agents if agents else default_ua
+    except FileNotFoundError:
+        logger.warning(f"User-Agents file not found: {file_path}")
+        return default_ua
+
+
+@dataclass(slots=True)
+class _Inflight:
+    """
+    A request shared by HttpClient.dedup() callers.
+    
+    Attributes:
+        started: Monotonic time the request was started.
+        task: Task performing the request.
+        waiters: Callers currently awaiting the task.
+    """
+    started: float
+    task: "asyncio.Future[Any]"
+    waiters: int = 0
+
+
+@dataclass(slots=True)
+class _Pace:
+    """
+    Request pacing for one credential (or for unauthenticated requests).
+    
+    Attributes:
+        remaining: Budget reported by the last response, if any.
+        reset_ts: Unix time the budget resets.
+        next_send: Monotonic time the last reserved request slot opens.
+    """
+    remaining: Optional[int] = None
+    reset_ts: float = 0.0
+    next_send: float = 0.0
+
 
 class HttpClient:
     """
-    HTTP client wrapper with retry logic, jitter delays, and User-Agent rotation.
+    Async HTTP client wrapper with retry logic, jitter delays, and User-Agent rotation.
     
     Attributes:
-        session: Requests session for connection pooling.
+        session: httpx AsyncClient for connection pooling.
         min_delay: Minimum delay between requests.
         max_delay: Maximum delay between requests.
         timeout: Request timeout in seconds.
-        user_agents: List of User-Agent strings for rotation.
+        user_agents: Tuple of User-Agent strings for rotation.
     """
     
+    __slots__ = (
+        "min_delay",
+        "max_delay",
+        "timeout",
+        "max_retries",
+        "max_connections",
+        "_paces",
+        "_rng",
+        "_delay_fn",
+        "user_agents",
+        "_ua_count",
+        "_base_headers",
+        "session",
+        "_inflight",
+    )
+    
+    # Server errors retried with exponential backoff
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    MAX_CONNECTIONS = 20
+    # Probe idle pooled sockets so dead connections are noticed early
+    SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Outlive the pacing delay between requests so connections get reused
+    KEEPALIVE_EXPIRY = 60.0
+    # Shortest paced delay, so a large budget never means bursting
+    MIN_PACED_DELAY = 0.05
+    DEDUP_TTL = 5.0  # Seconds a finished request is shared with duplicates
+    DEDUP_MAX_ENTRIES = 256  # Prune finished entries beyond this many
+    
     def __init__(
         self,
         min_delay: float = 2.0,
@@ -33,6 +119,7 @@ class HttpClient:
         timeout: int = 15,
         max_retries: int = 3,
         user_agents_file: Optional[Path] = None,
+        max_connections: Optional[int] = None,
     ):
         """
         Initialize the HTTP client.
@@ -43,67 +130,63 @@ class HttpClient:
             timeout: Request timeout (seconds).
             max_retries: Maximum retry attempts.
             user_agents_file: Path to User-Agents file.
+            max_connections: Connection pool size (defaults to MAX_CONNECTIONS).
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.timeout = timeout
         self.max_retries = max_retries
-        self._fixed_delay: Optional[float] = None
-        self._delay_range: Optional[Tuple[float, float]] = None
+        self.max_connections = max_connections or self.MAX_CONNECTIONS
+        # Authorization header (None without one) -> budget and next slot;
+        # each token's quota is paced on its own
+        self._paces: Dict[Optional[str], _Pace] = {}
+        # Own generator for jitter and User-Agent picks
+        self._rng = random.Random()
+        # Delay strategy, replaced by set_delay() when -D is given
+        self._delay_fn: Callable[[_Pace], float] = self._paced_delay
+        
+        # Load User-Agents (shared by every client reading the same file)
+        self.user_agents = _load_user_agents(
+            Path(user_agents_file) if user_agents_file else DEFAULT_USER_AGENTS_FILE
+        )
+        self._ua_count = len(self.user_agents)
         
-        # Load User-Agents
-        self.user_agents = self._load_user_agents(user_agents_file)
+        # Static headers; User-Agent and caller headers are merged per request
+        self._base_headers = {"Accept": "application/vnd.github.v3+json"}
+        
+        # Request key -> request shared by dedup()
+        self._inflight: Dict[Hashable, _Inflight] = {}
         
         # Create session with retry strategy
         self.session = self._create_session()
     
-    def _load_user_agents(self, file_path: Optional[Path] = None) -> list[str]:
+    def _create_session(self) -> httpx.AsyncClient:
         """
-        Load User-Agents from file.
+        Create an async client with connection-level retries.
         
-        Args:
-            file_path: Path to User-Agents file.
-            
-        Returns:
-            List of User-Agent strings.
-        """
-        if file_path is None:
-            file_path = Path(__file__).parent.parent.parent / "user_agents.txt"
-        
-        default_ua = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        ]
-        
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                agents = [line.strip() for line in f if line.strip()]
-                return agents if agents else default_ua
-        except FileNotFoundError:
-            logger.warning(f"User-Agents file not found: {file_path}")
-            return default_ua
-    
-    def _create_session(self) -> requests.Session:
-        """
-        Create a requests session with retry strategy.
+        The client is shared by every engine, and HTTP/2 lets concurrent
+        searches multiplex over one keep-alive TLS connection per host.
         
         Returns:
-            Configured requests Session.
+            Configured httpx AsyncClient.
         """
-        session = requests.Session()
-        
-        # Retry strategy for 5xx errors
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=1,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET", "HEAD"],
+        # Retries connection failures; 5xx responses are retried in get()
+        transport = httpx.AsyncHTTPTransport(
+            retries=self.max_retries,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+            socket_options=self.SOCKET_OPTIONS,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        
-        return session
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
     
     def set_delay(self, delay_str: str) -> None:
         """
@@ -116,32 +199,58 @@ class HttpClient:
             parts = delay_str.split("-")
             if len(parts) == 2:
                 try:
-                    self._delay_range = (float(parts[0]), float(parts[1]))
-                    self._fixed_delay = None
-                    logger.info(f"Delay set to random range: {self._delay_range[0]}-{self._delay_range[1]}s")
+                    low, high = float(parts[0]), float(parts[1])
+                    self._delay_fn = lambda pace: self._rng.uniform(low, high)
+                    logger.info(f"Delay set to random range: {low}-{high}s")
                 except ValueError:
                     logger.warning(f"Invalid delay range: {delay_str}, using defaults")
         else:
             try:
-                self._fixed_delay = float(delay_str)
-                self._delay_range = None
-                logger.info(f"Delay set to fixed: {self._fixed_delay}s")
+                fixed = float(delay_str)
+                self._delay_fn = lambda pace: fixed
+                logger.info(f"Delay set to fixed: {fixed}s")
             except ValueError:
                 logger.warning(f"Invalid delay value: {delay_str}, using defaults")
     
-    def _get_delay(self) -> float:
+    def _paced_delay(self, pace: _Pace) -> float:
         """
-        Get the delay to apply before next request.
+        Get the default delay to apply before next request.
+        
+        Once a response has reported the credential's rate limit budget,
+        the remaining requests are spread evenly until the reset (with
+        +/-20% jitter), so a nearly spent budget waits out most of the
+        window. Without a budget the configured range is used.
         
+        Args:
+            pace: Pacing state of the credential sending the request.
+            
         Returns:
             Delay in seconds.
         """
-        if self._fixed_delay is not None:
-            return self._fixed_delay
-        elif self._delay_range is not None:
-            return random.uniform(self._delay_range[0], self._delay_range[1])
+        if pace.remaining:
+            delay = (pace.reset_ts - time.time()) / pace.remaining
+            delay *= self._rng.uniform(0.8, 1.2)
+            return max(self.MIN_PACED_DELAY, delay)
         else:
-            return random.uniform(self.min_delay, self.max_delay)
+            return self._rng.uniform(self.min_delay, self.max_delay)
+    
+    def _note_rate_limit(self, pace: _Pace, headers: httpx.Headers) -> None:
+        """
+        Remember the rate limit budget reported by a response.
+        
+        Args:
+            pace: Pacing state of the credential that sent the request.
+            headers: Response headers; ignored if they carry no budget.
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            pace.remaining = int(remaining)
+            pace.reset_ts = float(reset)
+        except ValueError:
+            pass
     
     def _get_random_user_agent(self) -> str:
         """
@@ -150,23 +259,36 @@ class HttpClient:
         Returns:
             Random User-Agent string.
         """
-        return random.choice(self.user_agents)
+        return self.user_agents[self._rng.randrange(self._ua_count)]
     
-    def _apply_jitter(self) -> None:
-        """Apply random delay between requests."""
-        delay = self._get_delay()
-        time.sleep(delay)
+    async def _apply_jitter(self, pace: _Pace) -> None:
+        """
+        Apply random delay between requests.
+        
+        The client is shared by every worker, so each call reserves the
+        credential's next slot one delay after the previous one instead
+        of sleeping on its own; concurrent callers don't multiply the
+        intended rate.
+        
+        Args:
+            pace: Pacing state of the credential sending the request.
+        """
+        now = time.monotonic()
+        pace.next_send = max(now, pace.next_send) + self._delay_fn(pace)
+        await asyncio.sleep(pace.next_send - now)
     
-    def get(
+    async def get(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
         apply_jitter: bool = True,
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """
         Perform a GET request with jitter and User-Agent rotation.
         
+        Server errors (5xx) are retried with exponential backoff.
+        
         Args:
             url: Target URL.
             headers: Additional headers.
@@ -177,39 +299,123 @@ class HttpClient:
             Response object.
             
         Raises:
-            requests.RequestException: On request failure after retries.
+            httpx.HTTPError: On request failure after retries.
         """
+        credential = headers.get("Authorization") if headers else None
+        pace = self._paces.get(credential)
+        if pace is None:
+            pace = self._paces[credential] = _Pace()
+        
         if apply_jitter:
-            self._apply_jitter()
+            await self._apply_jitter(pace)
         
         # Merge headers with random User-Agent
         request_headers = {
+            **self._base_headers,
             "User-Agent": self._get_random_user_agent(),
-            "Accept": "application/vnd.github.v3+json",
+            **(headers or {}),
         }
-        if headers:
-            request_headers.update(headers)
         
         try:
-            response = self.session.get(
-                url,
-                headers=request_headers,
-                params=params,
-                timeout=self.timeout,
-            )
-            return response
+            for attempt in range(self.max_retries + 1):
+                response = await self.session.get(
+                    url,
+                    headers=request_headers,
+                    params=params,
+                )
+                self._note_rate_limit(pace, response.headers)
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                    return response
+                await asyncio.sleep(2 ** attempt)
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.error(f"Request timeout: {url}")
             raise
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             logger.error(f"Connection error: {url}")
             raise
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request failed: {e}")
             raise
     
-    def close(self) -> None:
+    async def dedup(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run a request once for all concurrent callers with the same key.
+        
+        Callers asking for a request that is in flight, or that finished
+        less than DEDUP_TTL seconds ago, share its result instead of
+        spending quota on a duplicate. Failed requests (exceptions or
+        None) are not shared once they finish. A request is cancelled
+        when its last waiter is.
+        
+        Args:
+            key: Canonical request key (endpoint, params, extra headers).
+            fetch: Coroutine factory that performs the request.
+            
+        Returns:
+            The request's result.
+        """
+        now = time.monotonic()
+        entry = self._inflight.get(key)
+        if entry is None or (
+            entry.task.done() and now - entry.started >= self.DEDUP_TTL
+        ):
+            if len(self._inflight) > self.DEDUP_MAX_ENTRIES:
+                # Drop finished entries past their TTL
+                for stale in [
+                    k for k, e in self._inflight.items()
+                    if e.task.done() and now - e.started >= self.DEDUP_TTL
+                ]:
+                    del self._inflight[stale]
+            
+            entry = _Inflight(now, asyncio.ensure_future(fetch()))
+            self._inflight[key] = entry
+            
+            def forget_failure(done: "asyncio.Future[Any]") -> None:
+                failed = done.cancelled() or done.exception() is not None
+                if not failed and done.result() is not None:
+                    return
+                self._forget(key, entry)
+            
+            entry.task.add_done_callback(forget_failure)
+        
+        entry.waiters += 1
+        try:
+            # Shield so one caller being cancelled doesn't cancel the others
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if entry.waiters == 0 and not entry.task.done():
+                # Nobody wants the result any more; stop spending quota
+                entry.task.cancel()
+                self._forget(key, entry)
+    
+    def _forget(self, key: Hashable, entry: _Inflight) -> None:
+        """Stop sharing a request, unless its key was reused since."""
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+    
+    async def warm_up(self, url: str) -> None:
+        """
+        Open a pooled connection to a host before the first real request.
+        
+        The TLS handshake then overlaps the pacing delay instead of
+        adding to the first search. Failures are ignored; the real
+        request will surface them.
+        
+        Args:
+            url: Any URL on the host to connect to.
+        """
+        try:
+            await self.session.head(url, headers=self._base_headers)
+        except httpx.HTTPError:
+            pass
+    
+    async def close(self) -> None:
         """Close the session."""
-        self.session.close()
+        await self.session.aclose()
 
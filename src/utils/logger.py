@@ -2,10 +2,13 @@
 Centralized logging module using Rich library for beautiful console output.
 """
 
-import sys
-from datetime import datetime
+import asyncio
+import math
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -18,7 +21,8 @@ from rich.progress import (
     TimeRemainingColumn,
     TimeElapsedColumn,
 )
-from rich.table import Table
+from rich.table import Column, Table
+from rich.text import Text
 from rich.theme import Theme
 from rich import box
 
@@ -37,10 +41,54 @@ PIGGIE_THEME = Theme({
 
 console = Console(theme=PIGGIE_THEME)
 
+# Minimum level shown: TRUFFLEPIGGIE_LOG_LEVEL (info, warning or error),
+# overridden by set_level() (-v/--verbose forces info)
+_LEVEL_RANK = {"info": 0, "highlight": 0, "success": 0, "warning": 1, "error": 2}
+_LEVEL_ENABLED: Dict[str, bool] = {}
 
+
+def set_level(level: str) -> None:
+    """
+    Set the minimum level of messages to display.
+    
+    Args:
+        level: "info", "warning" or "error"; unknown names mean "info".
+    """
+    min_rank = {"info": 0, "warning": 1, "error": 2}.get(level.lower(), 0)
+    for name, rank in _LEVEL_RANK.items():
+        _LEVEL_ENABLED[name] = rank >= min_rank
+
+
+set_level(os.environ.get("TRUFFLEPIGGIE_LOG_LEVEL", "info"))
+
+
+def _emit(level: str, prefix: str, message: str) -> None:
+    """
+    Print a timestamped message if its level is enabled.
+    
+    The line is built as styled Text, so only messages that actually
+    contain markup go through Rich's markup parser.
+    
+    Args:
+        level: Level name, also used as the theme style.
+        prefix: Prefix character for the message.
+        message: The message to display.
+    """
+    if not _LEVEL_ENABLED[level]:
+        return
+    line = Text(time.strftime("%H:%M:%S"), style="dim")
+    line.append(f" [{prefix}] ")
+    if "[" in message:
+        line.append_text(Text.from_markup(message, style=level))
+    else:
+        line.append(message, style=level)
+    console.print(line)
+
+
+@lru_cache(maxsize=1)
 def load_banner() -> str:
     """
-    Load ASCII art banner from file.
+    Load ASCII art banner from file (read once, then cached).
     
     Returns:
         str: The ASCII art banner string.
@@ -62,8 +110,7 @@ def load_banner() -> str:
 
 def print_banner() -> None:
     """Display the TrufflePiggie ASCII art banner."""
-    banner = load_banner()
-    console.print(f"[banner]{banner}[/banner]")
+    console.print(load_banner(), style="banner", markup=False, highlight=False)
     console.print(
         Panel(
             "[dim]GitHub Repository & Gist OSINT Scanner for TruffleHog[/dim]",
@@ -82,8 +129,7 @@ def info(message: str, prefix: str = "ℹ") -> None:
         message: The message to display.
         prefix: Prefix character for the message.
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    console.print(f"[dim]{timestamp}[/dim] [{prefix}] [info]{message}[/info]")
+    _emit("info", prefix, message)
 
 
 def success(message: str, prefix: str = "✓") -> None:
@@ -94,8 +140,7 @@ def success(message: str, prefix: str = "✓") -> None:
         message: The message to display.
         prefix: Prefix character for the message.
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    console.print(f"[dim]{timestamp}[/dim] [{prefix}] [success]{message}[/success]")
+    _emit("success", prefix, message)
 
 
 def warning(message: str, prefix: str = "⚠") -> None:
@@ -106,8 +151,7 @@ def warning(message: str, prefix: str = "⚠") -> None:
         message: The message to display.
         prefix: Prefix character for the message.
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    console.print(f"[dim]{timestamp}[/dim] [{prefix}] [warning]{message}[/warning]")
+    _emit("warning", prefix, message)
 
 
 def error(message: str, prefix: str = "✗") -> None:
@@ -118,8 +162,7 @@ def error(message: str, prefix: str = "✗") -> None:
         message: The message to display.
         prefix: Prefix character for the message.
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    console.print(f"[dim]{timestamp}[/dim] [{prefix}] [error]{message}[/error]")
+    _emit("error", prefix, message)
 
 
 def highlight(message: str, prefix: str = "→") -> None:
@@ -130,8 +173,7 @@ def highlight(message: str, prefix: str = "→") -> None:
         message: The message to display.
         prefix: Prefix character for the message.
     """
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    console.print(f"[dim]{timestamp}[/dim] [{prefix}] [highlight]{message}[/highlight]")
+    _emit("highlight", prefix, message)
 
 
 def token_status(token_id: str, remaining: int, reset_time: str) -> None:
@@ -169,6 +211,16 @@ def create_progress() -> Progress:
     )
 
 
+# (header, style, width) of the results table columns. Rich stores cells on
+# Column objects, so each table gets fresh columns built from these specs.
+_RESULTS_COLUMNS = (
+    ("Type", "yellow", 10),
+    ("Repository/Gist", "green", None),
+    ("URL", "blue", None),
+    ("Date", "dim", 12),
+)
+
+
 def create_results_table(title: str = "Search Results") -> Table:
     """
     Create a table for displaying results.
@@ -179,18 +231,13 @@ def create_results_table(title: str = "Search Results") -> Table:
     Returns:
         Table: Configured Rich table.
     """
-    table = Table(
+    return Table(
+        *(Column(header, style=style, width=width) for header, style, width in _RESULTS_COLUMNS),
         title=title,
         box=box.ROUNDED,
         show_lines=True,
         header_style="bold cyan",
     )
-    table.add_column("Type", style="yellow", width=10)
-    table.add_column("Repository/Gist", style="green")
-    table.add_column("URL", style="blue")
-    table.add_column("Date", style="dim", width=12)
-    
-    return table
 
 
 def print_stats(
@@ -232,11 +279,28 @@ def countdown(seconds: int, message: str = "Waiting for rate limit reset") -> No
         seconds: Number of seconds to count down.
         message: Message to display during countdown.
     """
-    import time
+    deadline = time.monotonic() + seconds
+    with console.status(f"[yellow]{message}...[/yellow]") as status:
+        while (remaining := deadline - time.monotonic()) > 0:
+            mins, secs = divmod(math.ceil(remaining), 60)
+            status.update(f"[yellow]{message}... {mins:02d}:{secs:02d}[/yellow]")
+            # Wake on the next whole second so the display never drifts
+            time.sleep(remaining % 1 or 1)
+
+
+async def acountdown(seconds: int, message: str = "Waiting for rate limit reset") -> None:
+    """
+    Display a countdown timer without blocking the event loop.
     
+    Args:
+        seconds: Number of seconds to count down.
+        message: Message to display during countdown.
+    """
+    deadline = time.monotonic() + seconds
     with console.status(f"[yellow]{message}...[/yellow]") as status:
-        for remaining in range(seconds, 0, -1):
-            mins, secs = divmod(remaining, 60)
+        while (remaining := deadline - time.monotonic()) > 0:
+            mins, secs = divmod(math.ceil(remaining), 60)
             status.update(f"[yellow]{message}... {mins:02d}:{secs:02d}[/yellow]")
-            time.sleep(1)
+            # Wake on the next whole second so the display never drifts
+            await asyncio.sleep(remaining % 1 or 1)
 